@@ -2,15 +2,114 @@ import serial
 import threading
 import time
 import re
-import binascii
-import queue
 import os
+import queue
+import collections
+import logging
+from functools import lru_cache
 from PyQt5.QtCore import QObject, pyqtSignal, QDateTime, QTimer
-from sms_utils import text_to_ucs2, ucs2_to_text, is_chinese_text, format_phone_number
+from sms_utils import text_to_ucs2, ucs2_to_text, format_phone_number
 
 # Import serial.tools.list_ports for port detection
 import serial.tools.list_ports
 
+# 配置日志记录
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("LTE_Manager")
+
+# 预编译的AT响应/非请求响应正则表达式
+_CLIP_RE = re.compile(r'\+CLIP: "([^"]+)"')
+_VEND_RE = re.compile(r'VOICE CALL: END: (\d+)')
+_MISSED_RE = re.compile(r'MISSED_CALL: ([^\r\n]+)')
+# 只匹配"+CMT:"之后的部分（分发器已确认前缀），用match(line, 5)锚定
+_CMT_RE = re.compile(r'\s*"([^"]*)",[^,]*,"([^"]*)"')
+_CMTI_RE = re.compile(r'\+CMTI: "([^"]+)",(\d+)')
+_RXDTMF_RE = re.compile(r'\+RXDTMF: (\d)')
+_CGMR_RE = re.compile(r'\+CGMR: (.+)')
+_CNUM_RE = re.compile(r'\+CNUM: "[^"]*","([^"]+)"')
+_COPS_RE = re.compile(r'\+COPS: \d+,\d+,"([^"]+)"')
+_CPSI_RE = re.compile(r'\+CPSI:(.+)')
+_CSQ_RE = re.compile(r'\+CSQ: (\d+),')
+_CNUM_FULL_RE = re.compile(r'\+CNUM: "([^"]*)",("?[^"]*"?),(\d+)')
+_COPS_FULL_RE = re.compile(r'\+COPS: (\d+),(\d+),"([^"]*)"')
+_CSQ_FULL_RE = re.compile(r'\+CSQ: (\d+),(\d+)')
+_CEREG_RE = re.compile(r'\+CEREG: \d+,(\d+)')
+_CREG_RE = re.compile(r'\+CREG: \d+,(\d+)')
+_CGREG_REGISTERED_RE = re.compile(r'\+CGREG: \d+,[15]')
+_CMGR_HDR_RE = re.compile(r'\+CMGR: "[^"]*","([^"]*)",[^,]*,"([^"]*)"')
+_CLCC_RE = re.compile(r'\+CLCC:\s*(\d+),(\d+),(\d+),(\d+),(\d+)(?:,"([^"]*)",(\d+)(?:,"([^"]*)")?)?')
+# +CMGL头部行及其下一行的短信内容，一次finditer解析整个短信列表
+_CMGL_FULL_RE = re.compile(r'^\+CMGL: (\d+),"([^"]*)","([^"]*)",[^,\n]*,"([^"]*)"[^\n]*\n([^\n]*)', re.M)
+# 文本模式短信内容允许的字符，出现其他字符时按PDU数据处理
+_PRINTABLE_RE = re.compile(r'[\w\s+\-,.;:!?]*')
+
+# 十六进制字符串（可含空格），只做校验不解析时使用，与_try_hex的判断一致
+_HEX_RE = re.compile(r'[0-9A-Fa-f ]*')
+
+# 长短信内容中的URL和前缀
+_URL_RE = re.compile(r'(https?://\S+)')
+_URL_COLON_RE = re.compile(r':(https?://\S+)')
+_URL_SCHEME_RE = re.compile(r'https?://')
+_PREFIX_RE = re.compile(r'([^:]+):')
+
+# 不作为非请求响应处理的行：命令回显、最终结果和常见查询响应
+_DISCARD_PREFIXES = ("AT", "+CSQ", "+CREG", "+CGREG")
+_DISCARD_LINES = frozenset({"OK", "ERROR"})
+
+# 频繁发送的固定AT命令，预先编码好字节串
+_ENCODED_COMMANDS = {
+    command: (command + "\r\n").encode()
+    for command in ("AT", "ATE0", "AT+CSQ", "AT+CREG?", "AT+CGREG?", "AT+CEREG?", "AT+CLCC", "AT+CPSI?", "AT+COPS?")
+}
+
+# 响应不写入命令缓存的AT命令：实时状态查询，以及每次参数不同的短信读写、删除和拨号命令
+_UNCACHED_COMMANDS = frozenset({"AT+CSQ", "AT+CLCC", "AT+CPSI?", "AT+CREG?", "AT+CGREG?", "AT+CEREG?"})
+_UNCACHED_PREFIXES = ("AT+CMGR=", "AT+CMGD=", "AT+CMGL", "AT+CMGS=", "ATD")
+
+# AT命令日志目录（只计算一次）
+_LTE_DIR = os.path.join(os.path.expanduser("~"), ".LTE")
+
+# 已知格式长短信的固定开头（UCS2编码）
+_CONCAT_MARKER = "62117ED94F6053D14E86957F6587672C"
+# "https" 的UCS2编码
+_UCS2_HTTPS = "00680074007400700073"
+
+
+@lru_cache(maxsize=256)
+def _ucs2_cached(hex_str):
+    """带缓存的ucs2_to_text，长短信各部分重复出现的内容只解码一次"""
+    return ucs2_to_text(hex_str)
+
+
+def _decode_ucs2(hex_str):
+    """把UCS2十六进制字符串直接解码为文本
+
+    已知格式长短信（需要提取URL部分）和非十六进制内容仍交给ucs2_to_text处理
+    """
+    if not hex_str.startswith(_CONCAT_MARKER):
+        text = hex_str.replace(" ", "")
+        if len(text) % 2:
+            text += "0"  # 与ucs2_to_text一致，奇数长度补0
+        try:
+            return bytes.fromhex(text).decode('utf-16-be', errors='replace')
+        except ValueError:
+            pass
+    return _ucs2_cached(hex_str)
+
+
+@lru_cache(maxsize=128)
+def _fmt_number(number):
+    """带缓存的format_phone_number，同一号码重复发送短信时只格式化一次"""
+    return format_phone_number(number)
+
+
+@lru_cache(maxsize=128)
+def _number_to_ucs2(number):
+    """带缓存的号码UCS2编码（号码会重复出现，短信内容则不会）"""
+    return text_to_ucs2(number)
+
+
 class LTEManager(QObject):
     # Signals
     sms_received = pyqtSignal(str, str, str)  # sender, timestamp, message
@@ -19,6 +118,20 @@ class LTEManager(QObject):
     status_changed = pyqtSignal(str)  # status message
     dtmf_received = pyqtSignal(str)  # DTMF tone
     pcm_audio_status = pyqtSignal(bool)  # PCM audio registration status (True=registered, False=unregistered)
+    # 读取线程收到的非请求响应行，跨线程发出，由Qt排队投递到Qt线程处理
+    _urc_received = pyqtSignal(str)
+
+    # 各项状态信息的缓存时间（秒）
+    _STATUS_TTL = {
+        'phone': 1800,       # 电话号码 AT+CNUM
+        'carrier': 600,      # 运营商 AT+COPS?
+        'network': 600,      # 网络类型 AT+CPSI?
+        'module': 3600,      # 模块信息 AT+CGMI等
+        'call_status': 0.5,  # 通话状态 AT+CLCC
+    }
+
+    # 命令超时后留在待响应列表中的占位记录最多再等待多久（秒），过期后认为模块不会再应答
+    _STALE_DRAIN = 2.0
 
     def __init__(self):
         super().__init__()
@@ -29,13 +142,23 @@ class LTEManager(QObject):
         self.at_baudrate = 115200
         self.nmea_baudrate = 9600
         self.connected = False
+        # 回显已关闭（ATE0返回OK）时send_at_batch才流水线发送；本次连接中模块丢弃过流水线命令后不再流水线发送
+        self.echo_off = False
+        self.pipeline_ok = True
         self.running = False  # Flag to control the read thread
         self.read_thread = None
-        self.response_queue = queue.Queue()
+        # 等待响应的AT命令（按发送顺序排列，模块按顺序应答）
+        # 每项为 {'tag': 响应前缀, 'lines': 响应行, 'event': 收到最终结果时置位}
+        self._pending = collections.deque()
         self.lock = threading.Lock()
+        # 待响应列表有命令完成或被清空时通知（与self.lock共用同一把锁）
+        self._pending_changed = threading.Condition(self.lock)
+        # 串口写入锁：保证AT+CMGS提示符等待期间其他命令不会插入写入
+        self.write_lock = threading.RLock()
 
-        # Command cache
-        self.command_cache = {}
+        # Command cache（按最近使用排序，超过command_cache_size条时淘汰最旧的）
+        self.command_cache = collections.OrderedDict()
+        self.command_cache_size = 64
 
         # Module information
         self.imei = ""
@@ -46,6 +169,10 @@ class LTEManager(QObject):
         self.phone_number = ""
         self.carrier = ""
         self.network_type = ""
+        # 状态缓存的上次更新时间（time.monotonic()，-inf表示尚未查询），时长见_STATUS_TTL
+        self._status_times = dict.fromkeys(self._STATUS_TTL, float('-inf'))
+        self.cached_call_status = []
+        self.call_status_valid = False  # 最近一次AT+CLCC是否收到并解析了OK响应（区分"没有通话"和查询失败）
         self.signal_strength = ""
 
         # Call status
@@ -66,28 +193,76 @@ class LTEManager(QObject):
         self.waiting_for_sms_content = False
         self.pending_sms_sender = None
         self.pending_sms_timestamp = None
+        self.current_sms_id = None  # +CMT头部生成的短信ID，供下一行内容处理使用
+        self.current_is_continuation = False  # 当前短信是否为已有长短信的后续部分
+
+        # 非请求响应分发表：按行首前缀（冒号之前）查找处理函数
+        self._urc_handlers = {
+            'RING': self._on_ring,
+            '+CLIP': self._on_clip,
+            '+CMT': self._on_cmt,
+            '+CMTI': self._on_cmti,
+            '+RXDTMF': self._on_dtmf,
+            'NO CARRIER': self._on_no_carrier,
+            'MISSED_CALL': self._on_missed_call,
+            '+SMS FULL': self._on_sms_full,
+        }
+        # 前缀表未命中时按子串匹配的非请求响应：只有VOICE CALL的BEGIN/END共用同一前缀，无法按前缀区分
+        self._urc_substring_handlers = [
+            ("VOICE CALL: BEGIN", self._on_voice_call_begin),
+            ("VOICE CALL: END:", self._on_voice_call_end),
+        ]
 
         # 长短信处理
-        self.concat_sms_parts = {}  # 用于存储长短信的各个部分
+        self.concat_sms_parts = collections.OrderedDict()  # 用于存储长短信的各个部分（按最近接收时间排序）
         self.concat_sms_timeout = 30  # 长短信合并超时时间（秒）
+        self.concat_sms_max = 256  # 最多保留的长短信记录数，超过时淘汰最久未更新的
 
-        # 启动定期清理超时长短信的定时器
+        # 定期清理超时长短信的定时器：有长短信记录时才启动，记录清空后停止
         self.cleanup_timer = QTimer()
         self.cleanup_timer.timeout.connect(self._cleanup_old_sms_parts)
-        self.cleanup_timer.start(10000)  # 每10秒清理一次
+
+        # 非请求响应由读取线程通过信号交给Qt线程处理，避免阻塞串口读取，空闲时也不需要定时轮询
+        self._urc_received.connect(self._handle_urc_line)
+
+        # 非请求响应触发的AT命令（读取短信、PCM注册/注销）在后台线程上按顺序执行，不阻塞Qt线程
+        self._at_tasks = queue.SimpleQueue()
+        self._at_task_thread = threading.Thread(target=self._run_at_tasks, daemon=True)
+        self._at_task_thread.start()
+
+        # 调试模式：开启后长短信处理等调试信息也会通过status_changed显示
+        # 设置环境变量LTE_DEBUG可在启动时直接开启
+        self.debug = False
+        if os.environ.get("LTE_DEBUG"):
+            self.set_debug(True)
 
         # 添加AT命令日志文件路径
         self.at_log_file = None
+        self._ts_cache = (0, "")  # 日志时间戳缓存：(秒, 格式化的日期时间前缀)
         self._setup_at_log_file()
 
+        # 日志写入带缓冲，定时刷新到磁盘，不再每行flush
+        self.log_flush_timer = QTimer()
+        self.log_flush_timer.timeout.connect(self._flush_at_log)
+        self.log_flush_timer.start(1000)  # 每秒刷新一次
+
+    def set_debug(self, enabled):
+        """开启或关闭调试模式"""
+        self.debug = bool(enabled)
+        logger.setLevel(logging.DEBUG if self.debug else logging.NOTSET)
+
+    def _dbg(self, msg):
+        """记录调试信息，调试模式下同时通过status_changed显示"""
+        logger.debug(msg)
+        if self.debug:
+            self.status_changed.emit(msg)
+
     def _setup_at_log_file(self):
         """设置AT命令日志文件"""
         try:
             # 确保.LTE目录存在
-            home_dir = os.path.expanduser("~")
-            lte_dir = os.path.join(home_dir, ".LTE")
-            if not os.path.exists(lte_dir):
-                os.makedirs(lte_dir)
+            lte_dir = _LTE_DIR
+            os.makedirs(lte_dir, exist_ok=True)
 
             # 清理旧日志文件（保留最近7天的日志）
             self._cleanup_old_log_files(lte_dir)
@@ -96,9 +271,9 @@ class LTEManager(QObject):
             today = time.strftime("%Y-%m-%d")
             log_file_path = os.path.join(lte_dir, f"at_commands_{today}.log")
 
-            # 以追加模式打开日志文件
-            self.at_log_file = open(log_file_path, "a", encoding="utf-8")
-            print(f"AT命令日志文件已创建: {log_file_path}")
+            # 以追加模式打开日志文件（64KB缓冲，由_flush_at_log定时刷新）
+            self.at_log_file = open(log_file_path, "a", encoding="utf-8", buffering=65536)
+            logger.info("AT命令日志文件已创建: %s", log_file_path)
 
             # 记录会话开始 - 使用time模块获取当前时间
             timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
@@ -107,7 +282,7 @@ class LTEManager(QObject):
 
             return True
         except Exception as e:
-            print(f"创建AT命令日志文件失败: {str(e)}")
+            logger.error("创建AT命令日志文件失败: %s", e)
             self.at_log_file = None
             return False
 
@@ -120,68 +295,82 @@ class LTEManager(QObject):
             max_age = current_time - (max_days * 24 * 60 * 60)
 
             # 遍历日志目录
-            for file in os.listdir(log_dir):
-                # 只处理AT命令日志文件
-                if file.startswith('at_commands_') and file.endswith('.log'):
-                    file_path = os.path.join(log_dir, file)
-                    # 获取文件修改时间
-                    file_time = os.path.getmtime(file_path)
-                    # 如果文件修改时间早于max_days天前，则删除
-                    if file_time < max_age:
-                        os.remove(file_path)
-                        print(f"已删除旧日志文件: {file}")
+            # scandir一次返回目录项，不必对每个文件单独拼接路径再stat
+            with os.scandir(log_dir) as entries:
+                for entry in entries:
+                    # 只处理AT命令日志文件
+                    if entry.name.startswith('at_commands_') and entry.name.endswith('.log'):
+                        # 如果文件修改时间早于max_days天前，则删除
+                        if entry.stat().st_mtime < max_age:
+                            os.remove(entry.path)
+                            logger.info("已删除旧日志文件: %s", entry.name)
+        except Exception as e:
+            logger.error("清理旧日志文件时出错: %s", e)
+
+    def _ts(self):
+        """返回带毫秒的日志时间戳，同一秒内复用已格式化的日期时间部分"""
+        now = time.time()
+        sec, ms = divmod(int(now * 1000), 1000)
+        cached_sec, prefix = self._ts_cache
+        if sec != cached_sec:
+            # (秒, 前缀) 作为一个元组整体替换，多线程读取时不会拿到不匹配的两部分
+            prefix = time.strftime("%Y-%m-%d %H:%M:%S.", time.localtime(sec))
+            self._ts_cache = (sec, prefix)
+        return f"{prefix}{ms:03d}"
+
+    def _flush_at_log(self):
+        """把缓冲的AT命令日志写入磁盘（定时调用，通话结束时也会调用）"""
+        try:
+            if self.at_log_file:
+                self.at_log_file.flush()
         except Exception as e:
-            print(f"清理旧日志文件时出错: {str(e)}")
+            logger.error("刷新AT命令日志出错: %s", e)
 
     def _log_at_interaction(self, command, response=None):
         """记录AT命令交互"""
         try:
             if self.at_log_file:
-                # 使用time模块获取时间戳
-                timestamp = time.strftime("%Y-%m-%d %H:%M:%S.") + f"{int(time.time() * 1000) % 1000:03d}"
+                timestamp = self._ts()
                 if command is not None:
                     # 只记录发送的命令
                     self.at_log_file.write(f"{timestamp} >>> {command}\n")
-                self.at_log_file.flush()
         except Exception as e:
-            print(f"记录AT命令时出错: {str(e)}")
+            logger.error("记录AT命令时出错: %s", e)
 
     def _log_response(self, command, response):
         """单独记录AT命令的响应，避免重复记录命令"""
         try:
             if self.at_log_file:
-                # 使用time模块获取时间戳
-                timestamp = time.strftime("%Y-%m-%d %H:%M:%S.") + f"{int(time.time() * 1000) % 1000:03d}"
+                timestamp = self._ts()
                 if response:
                     self.at_log_file.write(f"{timestamp} <<< {response}\n")
-                self.at_log_file.flush()
         except Exception as e:
-            print(f"记录AT命令响应时出错: {str(e)}")
+            logger.error("记录AT命令响应时出错: %s", e)
 
     def _log_unsolicited(self, response):
         """记录非请求的响应，使用独立的格式"""
         try:
             if self.at_log_file:
-                # 使用time模块获取时间戳
-                timestamp = time.strftime("%Y-%m-%d %H:%M:%S.") + f"{int(time.time() * 1000) % 1000:03d}"
+                timestamp = self._ts()
                 self.at_log_file.write(f"{timestamp} <UNSOLICITED> {response}\n")
-                self.at_log_file.flush()
         except Exception as e:
-            print(f"记录非请求响应时出错: {str(e)}")
+            logger.error("记录非请求响应时出错: %s", e)
 
     def connect(self, port=None, baudrate=115200):
         """Connect to the LTE module"""
         try:
             # Check if already connected
             if self.is_connected():
-                print("Already connected")
+                logger.info("Already connected")
                 return True
 
             # Initialize command cache
-            self.command_cache = {}
+            self.command_cache = collections.OrderedDict()
 
-            # 重置连接状态
+            # 重置连接状态（可能换了端口或模块已重启，回显和流水线状态需重新判断）
             self.connected = False
+            self.echo_off = False
+            self.pipeline_ok = True
 
             # Validate port
             if not port:
@@ -192,46 +381,62 @@ class LTEManager(QObject):
                     return False
 
             self.status_changed.emit(f"Connecting to {port}...")
-            print(f"尝试连接到端口: {port}, 波特率: {baudrate}")
+            logger.info("尝试连接到端口: %s, 波特率: %s", port, baudrate)
 
             # Make sure any previous connection is properly closed
             try:
                 if hasattr(self, 'at_serial') and self.at_serial:
                     self.at_serial.close()
                     time.sleep(0.5)  # Increased delay to give OS more time to release the port
-                    print(f"已关闭之前的串口连接，等待500ms")
+                    logger.info("已关闭之前的串口连接，等待500ms")
             except Exception as e:
-                print(f"Warning: Error closing previous serial connection: {str(e)}")
+                logger.warning("Error closing previous serial connection: %s", e)
 
             # Connect to the serial port
             try:
-                print(f"打开串口: {port}")
+                logger.info("打开串口: %s", port)
                 self.at_serial = serial.Serial(
                     port=port,
                     baudrate=baudrate,
                     bytesize=serial.EIGHTBITS,
                     parity=serial.PARITY_NONE,
                     stopbits=serial.STOPBITS_ONE,
-                    timeout=2.0,  # Increased timeout
+                    timeout=1.0,  # 读取线程阻塞读取的最长时间，需不超过disconnect中的join等待时间
                     write_timeout=1.0,
                     xonxoff=False,
                     rtscts=False,
                     dsrdtr=False
                 )
-                print(f"串口已打开，初始化响应队列")
+                logger.info("串口已打开，初始化待响应命令列表")
 
                 # Check if the port is open
                 if not self.at_serial.is_open:
-                    print(f"错误: 串口未能打开")
+                    logger.error("串口未能打开")
                     return False
 
-                # Initialize the response queue
-                self.response_queue = queue.Queue()
+                # 增大驱动接收缓冲区（仅Windows支持），避免长短信突发数据溢出
+                if hasattr(self.at_serial, 'set_buffer_size'):
+                    try:
+                        self.at_serial.set_buffer_size(rx_size=65536, tx_size=16384)
+                        logger.debug("串口接收缓冲区已设置为65536字节")
+                    except Exception as e:
+                        logger.warning("设置串口缓冲区大小失败: %s", e)
+
+                # 开启低延迟模式（仅Linux支持，ASYNC_LOW_LATENCY），USB串口不再按延迟定时器攒批数据
+                if hasattr(self.at_serial, 'set_low_latency_mode'):
+                    try:
+                        self.at_serial.set_low_latency_mode(True)
+                        logger.debug("串口低延迟模式已开启")
+                    except Exception as e:
+                        logger.warning("开启串口低延迟模式失败: %s", e)
+
+                # Initialize the pending command list
+                self._abort_pending()
 
                 # Clear any pending data
                 self.at_serial.reset_input_buffer()
                 self.at_serial.reset_output_buffer()
-                print(f"串口缓冲区已重置")
+                logger.info("串口缓冲区已重置")
 
                 # Set the running flag before starting the thread
                 self.running = True
@@ -239,11 +444,11 @@ class LTEManager(QObject):
                 # Start the read thread
                 self.read_thread = threading.Thread(target=self._read_thread, daemon=True)
                 self.read_thread.start()
-                print(f"读取线程已启动")
+                logger.info("读取线程已启动")
 
                 # 确保日志文件已创建 (但不重复创建)
                 if not self.at_log_file:
-                    print("创建AT命令日志文件...")
+                    logger.info("创建AT命令日志文件...")
                     self._setup_at_log_file()
 
                 # Wait for the thread to start reading
@@ -253,54 +458,46 @@ class LTEManager(QObject):
                 try:
                     self.at_serial.write(b'\r\n')
                     time.sleep(0.1)
-                    print("发送空行成功")
+                    logger.debug("发送空行成功")
                 except Exception as e:
-                    print(f"发送空行失败: {str(e)}")
+                    logger.error("发送空行失败: %s", e)
 
                 # Send AT command multiple times to ensure connection
-                print(f"发送AT测试命令...")
+                logger.info("发送AT测试命令...")
                 response = ""
                 for attempt in range(3):
                     try:
-                        # 直接使用串口写入，而不是send_at_command
-                        if attempt == 0:
-                            self.at_serial.write(b'AT\r\n')
-                            print("直接写入AT命令")
-                            time.sleep(0.2)
-                            # 读取响应
-                            data = self.at_serial.read(self.at_serial.in_waiting or 100)
-                            if data:
-                                response = data.decode('utf-8', errors='replace')
-                                print(f"直接读取响应: {response}")
-                                if "OK" in response:
-                                    print("直接通信成功!")
-                                    self.connected = True
-                                    break
-                        else:
-                            # 使用正常方法发送命令
-                            response = self.send_at_command("AT", timeout=2.0, retries=1)
-                            print(f"AT命令尝试 {attempt+1}/3 响应: {response}")
-                            if "OK" in response or self.connected:
-                                break
+                        # 读取线程已在运行，统一通过send_at_command等待响应，收到OK立即返回
+                        # （直接读取串口会与读取线程争抢数据）
+                        response = self.send_at_command("AT", timeout=2.0, retries=1)
+                        logger.debug("AT命令尝试 %s/3 响应: %s", attempt+1, response)
+                        if "OK" in response or self.connected:
+                            break
                     except Exception as e:
-                        print(f"AT命令尝试 {attempt+1} 失败: {str(e)}")
+                        logger.error("AT命令尝试 %s 失败: %s", attempt+1, e)
                     time.sleep(0.5)
+                    # 模块未应答本次探测（例如仍在启动），丢弃等待记录和可能迟到的响应后再试
+                    self._abort_pending()
+                    try:
+                        self.at_serial.reset_input_buffer()
+                    except Exception as e:
+                        logger.error("清空输入缓冲区失败: %s", e)
 
                 if self.connected:  # 使用self.connected标志，该标志在send_at_command中设置
                     self.status_changed.emit(f"Connected to {port}")
-                    print(f"成功连接到 {port}")
+                    logger.info("成功连接到 %s", port)
                     self.port = port
                     self.baudrate = baudrate
 
                     # Configure the module
-                    print(f"开始配置模块...")
+                    logger.info("开始配置模块...")
                     self._configure_module()
 
                     return True
                 else:
                     self.running = False  # Stop the read thread
                     self.status_changed.emit("Error: Module not responding")
-                    print(f"错误: 模块未响应, 响应内容: {response}")
+                    logger.error("模块未响应, 响应内容: %s", response)
                     if hasattr(self, 'at_serial') and self.at_serial and self.at_serial.is_open:
                         self.at_serial.close()
                     return False
@@ -308,12 +505,12 @@ class LTEManager(QObject):
             except Exception as e:
                 self.running = False  # Make sure thread stops if an error occurs
                 self.status_changed.emit(f"Error connecting: {str(e)}")
-                print(f"连接错误: {str(e)}")
+                logger.error("连接错误: %s", e)
                 return False
 
         except Exception as e:
             self.status_changed.emit(f"Error in connect: {str(e)}")
-            print(f"连接过程中发生错误: {str(e)}")
+            logger.error("连接过程中发生错误: %s", e)
             return False
 
     def disconnect(self):
@@ -326,7 +523,10 @@ class LTEManager(QObject):
                     try:
                         self.read_thread.join(1.0)  # Wait for thread to finish, timeout after 1 second
                     except Exception as e:
-                        print(f"Warning: Error waiting for read thread: {str(e)}")
+                        logger.warning("Error waiting for read thread: %s", e)
+
+                # 唤醒仍在等待响应的命令，不再让它们等到超时
+                self._abort_pending()
 
                 # Log disconnection
                 if self.at_log_file:
@@ -335,7 +535,7 @@ class LTEManager(QObject):
                     self.at_log_file.write(f"\n===== LTE管理器会话结束 {timestamp} =====\n\n")
                     self.at_log_file.flush()
                     self.at_log_file.close()
-                    print(f"AT命令日志文件已关闭: {self.at_log_file.name}")
+                    logger.info("AT命令日志文件已关闭: %s", self.at_log_file.name)
                     self.at_log_file = None
 
                 # Close the serial port
@@ -361,47 +561,56 @@ class LTEManager(QObject):
             cache_time, cache_result = self.command_cache[command]
             # 检查缓存是否过期 (500ms)
             if time.time() - cache_time < 0.5:
-                # 记录使用了缓存
-                print(f"使用缓存结果: {command}")
+                # 记录使用了缓存，命中的条目移到最近使用的一端
+                self.command_cache.move_to_end(command)
+                logger.debug("使用缓存结果: %s", command)
                 self._log_at_interaction(command, f"[CACHED] {cache_result}")
                 return cache_result
 
         # 初始化重试计数器
         retry_count = 0
 
-        print(f"发送AT命令: {command}, 超时: {timeout}秒, 最大重试次数: {retries}")
+        logger.debug("发送AT命令: %s, 超时: %s秒, 最大重试次数: %s", command, timeout, retries)
 
         while retry_count < retries:
+            entry = None
             try:
                 # 检查串口是否已打开（不检查self.connected标志）
                 if not hasattr(self, 'at_serial') or not self.at_serial or not self.at_serial.is_open:
                     error_msg = "ERROR: Serial port not open"
-                    print(f"命令发送失败: {error_msg}")
+                    logger.error("命令发送失败: %s", error_msg)
                     self._log_at_interaction(command, error_msg)
                     return error_msg
 
-                # 清空输入缓冲区
-                try:
-                    self.at_serial.reset_input_buffer()
-                    print(f"输入缓冲区已清空")
-                except Exception as e:
-                    print(f"清空输入缓冲区失败: {str(e)}")
-
                 # 记录发送的AT命令
                 self._log_at_interaction(command, None)
 
-                # 发送命令
-                cmd = command + "\r\n"
-                bytes_written = self.at_serial.write(cmd.encode())
-                print(f"发送命令: {command}，已写入 {bytes_written} 字节")
+                # 登记待响应命令并发送（在锁内完成，保证登记顺序与发送顺序一致）
+                entry = self._new_pending(command)
+                with self.write_lock, self.lock:
+                    # 没有其他命令在等待响应时才清空输入缓冲区，避免丢掉别的命令的响应
+                    self._await_stale_pending()
+                    if not self._pending:
+                        try:
+                            self.at_serial.reset_input_buffer()
+                            logger.debug("输入缓冲区已清空")
+                        except Exception as e:
+                            logger.error("清空输入缓冲区失败: %s", e)
 
-                # 确保命令已发送
-                self.at_serial.flush()
-                print(f"命令已刷新到设备")
+                    self._pending.append(entry)
+
+                    # 发送命令
+                    cmd_bytes = _ENCODED_COMMANDS.get(command) or (command + "\r\n").encode()
+                    bytes_written = self.at_serial.write(cmd_bytes)
+                    logger.debug("发送命令: %s，已写入 %s 字节", command, bytes_written)
+
+                    # 确保命令已发送
+                    self.at_serial.flush()
+                    logger.debug("命令已刷新到设备")
 
                 # 等待并读取响应
-                response = self._read_serial(timeout)
-                print(f"收到命令响应: {response}")
+                response = self._read_serial(entry, timeout)
+                logger.debug("收到命令响应: %s", response)
 
                 # 检查响应
                 if "ERROR" in response:
@@ -411,550 +620,719 @@ class LTEManager(QObject):
                     # 区分不同类型的错误
                     # 1. 查询命令返回ERROR - 这通常表示命令不支持，不需要重试
                     if command.endswith("=?") or command.endswith("?"):
-                        print(f"命令不支持: {command} -> {response}")
+                        logger.debug("命令不支持: %s -> %s", command, response)
                         # 将响应缓存并返回，不重试
-                        self.command_cache[command] = (time.time(), response)
+                        self._cache_response(command, response)
                         return response
 
                     # 2. CME ERROR或CMS ERROR - 这是带错误代码的特定错误，说明命令被识别但执行失败
                     if "+CME ERROR:" in response or "+CMS ERROR:" in response:
-                        print(f"命令执行错误: {command} -> {response}")
+                        logger.error("命令执行错误: %s -> %s", command, response)
                         # 如果是特定错误代码，不需要重试
-                        self.command_cache[command] = (time.time(), response)
+                        self._cache_response(command, response)
                         return response
 
                     # 3. 普通ERROR - 可能需要重试的通信问题
-                    print(f"命令执行错误: {command} -> {response}, 重试 {retry_count+1}/{retries}")
+                    logger.error("命令执行错误: %s -> %s, 重试 %s/%s", command, response, retry_count+1, retries)
                     retry_count += 1
                     time.sleep(0.5)  # 出错时延迟后重试
                     continue
                 else:
                     # 命令成功，记录并缓存响应
                     self._log_response(command, response)
-                    print(f"命令执行成功: {command}")
+                    logger.debug("命令执行成功: %s", command)
 
                     # 如果这是AT命令并且响应包含OK，则设置connected标志
                     if command == "AT" and "OK" in response:
                         self.connected = True
-                        print("连接状态已设置为已连接")
+                        logger.debug("连接状态已设置为已连接")
+                    elif command == "ATE0" and "OK" in response:
+                        self.echo_off = True
 
                     # 缓存响应结果
-                    self.command_cache[command] = (time.time(), response)
+                    self._cache_response(command, response)
                     return response
 
             except Exception as e:
-                print(f"命令 {command} 执行时出错: {str(e)}")
+                logger.error("命令 %s 执行时出错: %s", command, e)
+                if entry:
+                    self._discard_pending(entry)
                 error_msg = f"ERROR: {str(e)}"
                 retry_count += 1
                 time.sleep(0.5)  # 出错时延迟后重试
                 continue
 
         # 达到最大重试次数后返回错误
-        print(f"命令 {command} 已达到最大重试次数 {retries}，放弃执行")
+        logger.error("命令 %s 已达到最大重试次数 %s，放弃执行", command, retries)
         return f"ERROR: Max retries ({retries}) exceeded"
 
+    def send_at_batch(self, commands, timeout=5.0):
+        """一次写入多条AT命令，按发送顺序收集各自的响应，返回响应字符串列表
+
+        所有命令在一次write()中发出，只需等待一轮串口往返。回显未关闭（ATE0未成功）
+        或模块此前丢弃过流水线命令时，改为逐条用send_at_command发送。
+        ERROR/+CME ERROR是该命令自己的最终结果；所有命令共用一个截止时间，
+        截止时仍未完成的命令才被移除，并在整批结束后逐条重发
+        """
+        if not commands:
+            return []
+        if not self.at_serial or not self.at_serial.is_open:
+            return ["ERROR: Serial port not open"] * len(commands)
+        if not self.echo_off or not self.pipeline_ok:
+            return [self.send_at_command(command) for command in commands]
+
+        entries = [self._new_pending(command) for command in commands]
+        try:
+            with self.write_lock, self.lock:
+                # 没有其他命令在等待响应时才清空输入缓冲区
+                self._await_stale_pending()
+                if not self._pending:
+                    self.at_serial.reset_input_buffer()
+                self._pending.extend(entries)
+                self.at_serial.write(("\r\n".join(commands) + "\r\n").encode())
+                self.at_serial.flush()
+        except Exception as e:
+            logger.error("批量发送AT命令出错: %s", e)
+            for entry in entries:
+                self._discard_pending(entry)
+            return [self.send_at_command(command) for command in commands]
+
+        for command in commands:
+            self._log_at_interaction(command, None)
+
+        # 所有命令共用一个截止时间；模块按顺序应答，前一条未完成时后面的也不会完成
+        deadline = time.monotonic() + timeout
+        for entry in entries:
+            if not entry['event'].wait(max(0.0, deadline - time.monotonic())):
+                break
+
+        responses = []
+        for command, entry in zip(commands, entries):
+            # 截止时仍未完成的命令换成占位记录吸收迟到的响应，之后再逐条重发
+            self._abandon_pending(entry)
+            if entry['event'].is_set():
+                response = self._join_response(entry['lines'])
+                self._log_response(command, response)
+            else:
+                response = None
+            responses.append(response)
+
+        if None in responses:
+            self.pipeline_ok = False
+            logger.warning("模块未应答全部流水线命令，改为逐条发送")
+            responses = [
+                self.send_at_command(command) if response is None else response
+                for command, response in zip(commands, responses)
+            ]
+        return responses
+
+    def _cache_response(self, command, response):
+        """缓存命令响应；缓存有容量上限，实时查询和短信读取等带参数的命令不缓存"""
+        if command in _UNCACHED_COMMANDS or command.startswith(_UNCACHED_PREFIXES):
+            return
+        self.command_cache[command] = (time.time(), response)
+        self.command_cache.move_to_end(command)
+        if len(self.command_cache) > self.command_cache_size:
+            self.command_cache.popitem(last=False)
+
+    def _command_tag(self, command):
+        """获取AT命令对应的响应前缀集合，例如 AT+CSQ -> {+CSQ}，AT+CSQ;+COPS? -> {+CSQ, +COPS}
+
+        模块响应前缀总是大写，手动输入的小写命令（如at+csq）也按大写匹配
+        """
+        if command[:3].upper() != "AT+":
+            return None
+        return frozenset(part.split('=', 1)[0].rstrip('?').strip() for part in command[2:].upper().split(';'))
+
+    def _new_pending(self, command):
+        """创建一个待响应命令记录，由读取线程直接填充响应行，收到最终结果时置位event"""
+        return {'tag': self._command_tag(command), 'lines': [], 'event': threading.Event(), 'expires': None}
+
+    def _wait_pending(self, entry, timeout):
+        """等待命令完成并返回响应行；超时则返回已收到的部分响应
+
+        超时的命令不直接移除，而是换成占位记录继续吸收迟到的响应直到最终结果，
+        否则迟到的响应会被交给下一条命令
+        """
+        if not entry['event'].wait(timeout):
+            self._abandon_pending(entry)
+        return entry['lines']
+
+    def _abandon_pending(self, entry):
+        """把超时的命令记录替换为占位记录（保留响应前缀），占位记录在_STALE_DRAIN秒后过期"""
+        with self.lock:
+            try:
+                index = self._pending.index(entry)
+            except ValueError:
+                return  # 超时后刚好完成，或已被移除
+            self._pending[index] = {
+                'tag': entry['tag'], 'lines': [], 'event': threading.Event(),
+                'expires': time.monotonic() + self._STALE_DRAIN,
+            }
+
+    def _drop_stale_pending(self):
+        """移除队首已过期的占位记录（调用者须持有self.lock）"""
+        now = time.monotonic()
+        while self._pending and self._pending[0]['expires'] is not None and self._pending[0]['expires'] < now:
+            self._pending.popleft()
+
+    def _await_stale_pending(self):
+        """待响应列表中只剩占位记录时，等它们收完迟到的响应或过期后再写入新命令（调用者须持有self.lock）
+
+        丢失了响应的占位记录会吞掉下一条命令的应答，让后面的命令接连超时；
+        等到占位记录全部过期后直接清空列表，由调用者清空输入缓冲区
+        """
+        while self._pending and all(entry['expires'] is not None for entry in self._pending):
+            remaining = max(entry['expires'] for entry in self._pending) - time.monotonic()
+            if remaining <= 0:
+                self._pending.clear()
+                break
+            self._pending_changed.wait(remaining)
+
+    def _discard_pending(self, entry):
+        """从待响应列表中移除命令记录（超时或出错时）"""
+        with self.lock:
+            try:
+                self._pending.remove(entry)
+            except ValueError:
+                pass
+
+    def _abort_pending(self):
+        """一次性取出所有待响应命令并唤醒等待者（返回已收到的部分响应）"""
+        with self.lock:
+            pending, self._pending = self._pending, collections.deque()
+            self._pending_changed.notify_all()
+        for entry in pending:
+            entry['event'].set()
+
+    def _is_final_response(self, line):
+        """判断是否为AT命令的最终结果行"""
+        return line == "OK" or line == "ERROR" or "+CMS ERROR:" in line or "+CME ERROR:" in line
+
+    def _is_unsolicited(self, line, entry):
+        """判断命令等待响应期间收到的行是否为非请求响应"""
+        if self._is_final_response(line):
+            return False
+        prefix, sep, _ = line.partition(':')
+        if sep and entry['tag'] and prefix in entry['tag']:
+            return False
+        if prefix in self._urc_handlers:
+            return True
+        for marker, _ in self._urc_substring_handlers:
+            if marker in line:
+                return True
+        # 其余行（回显、数据行、前缀与命令不同的"+XXX:"行，如AT+CICCID的+ICCID:）都属于命令响应
+        return False
+
+    def _deliver_response_line(self, line):
+        """把响应行交给最早发送、仍在等待的命令；收到最终结果时完成该命令
+
+        返回False表示该行不属于命令响应（没有等待中的命令，或是非请求响应）
+        """
+        with self.lock:
+            self._drop_stale_pending()
+            if not self._pending:
+                return False
+            entry = self._pending[0]
+            if self._is_unsolicited(line, entry):
+                return False
+            entry['lines'].append(line)
+            if self._is_final_response(line):
+                self._pending.popleft()
+                entry['event'].set()
+                self._pending_changed.notify_all()
+            return True
+
     def _read_thread(self):
         """Thread function to continuously read from serial port"""
-        buffer = ""
+        buffer = bytearray()
+        sms_content_next = False  # +CMT头部之后的一行是短信内容，属于非请求响应
 
-        print("Serial read thread started")
+        logger.debug("Serial read thread started")
         while self.running:
             if not self.at_serial or not self.at_serial.is_open:
                 time.sleep(0.1)
                 continue
 
             try:
-                # Read data from serial port
-                if self.at_serial.in_waiting > 0:
-                    data = self.at_serial.read(self.at_serial.in_waiting)
-                    if data:
-                        text = data.decode('utf-8', errors='replace')
-                        buffer += text
-
-                        # Process complete lines
-                        while '\r\n' in buffer:
-                            line, buffer = buffer.split('\r\n', 1)
-                            line = line.strip()
-
-                            if not line:
-                                continue
-
-                            # Process unsolicited responses
-                            self._process_unsolicited(line)
-
-                            # Add to response queue for command responses
-                            self.response_queue.put(line)
-                else:
-                    # No data available, sleep briefly to reduce CPU usage
-                    time.sleep(0.01)
+                # 阻塞读取1字节（在内核中等待数据或超时），再一次性读取缓冲区中剩余的数据
+                data = self.at_serial.read(1)
+                if data:
+                    waiting = self.at_serial.in_waiting
+                    if waiting:
+                        data += self.at_serial.read(waiting)
+
+                    buffer += data
+
+                    # Process complete lines（只对完整的行解码）
+                    idx = buffer.find(b'\r\n')
+                    while idx >= 0:
+                        line = bytes(buffer[:idx]).decode('utf-8', errors='replace').strip()
+                        del buffer[:idx + 2]
+                        idx = buffer.find(b'\r\n')
+
+                        if not line:
+                            continue
+
+                        # 每行只交给一方：等待中的命令，或Qt线程的非请求响应处理
+                        if sms_content_next:
+                            sms_content_next = False
+                        elif self._deliver_response_line(line):
+                            continue
+                        else:
+                            sms_content_next = line.startswith("+CMT:")
+                        self._urc_received.emit(line)
             except Exception as e:
-                print(f"Serial read error: {str(e)}")
+                logger.error("Serial read error: %s", e)
                 time.sleep(0.1)
 
-        print("Serial read thread stopped")
+        logger.debug("Serial read thread stopped")
 
-    def _read_serial(self, timeout=5.0):
-        """读取串口响应，直到超时或收到完整响应"""
-        start_time = time.time()
-        response = []
-        command_echo_received = False
+    def _read_serial(self, entry, timeout=5.0):
+        """等待读取线程完成命令响应，直到超时或收到完整响应"""
+        logger.debug("等待AT命令响应，最大超时时间: %s秒", timeout)
 
-        print(f"等待AT命令响应，最大超时时间: {timeout}秒")
+        return self._join_response(self._wait_pending(entry, timeout))
 
-        # 等待响应，直到超时
-        while time.time() - start_time < timeout:
-            try:
-                # 使用queue.get()获取响应行
-                line = self.response_queue.get(timeout=0.2)
-                print(f"收到响应行: {line}")
-
-                # 检查是否是命令回显（某些模块会回显命令）
-                if not command_echo_received and line.startswith("AT"):
-                    command_echo_received = True
-                    # 可以选择跳过命令回显行，不添加到响应中
-                    continue
-
-                response.append(line)
-
-                # 检查是否为完整响应的各种情况
-                # 1. 标准的OK结束
-                if line == "OK":
-                    print("收到完整响应标识，结束等待")
-                    break
-
-                # 2. ERROR结束
-                elif line == "ERROR" or "+CMS ERROR:" in line or "+CME ERROR:" in line:
-                    print("收到完整响应标识，结束等待")
-                    break
-
-                # 3. 没有正常的结束标记，但对于某些特殊响应需要特殊处理
-                # 例如，对于COPS?命令如果收到了+COPS:行，可能不需要等待OK
-                elif "+COPS:" in line and "OK" not in response:
-                    # 继续等待OK，不直接退出
-                    pass
-
-                # 4. 对于返回消息体的命令，等待足够长的时间确保收到完整消息
-                # 特别是短信内容、通话状态等
-                elif "+CMGR:" in line or "+CMGL:" in line or "+CLCC:" in line:
-                    # 继续等待，这些命令通常有多行响应
-                    pass
-
-            except queue.Empty:
-                # 如果队列为空，检查是否已有足够的响应内容
-                # 如果已经收到至少一行，且最后一行包含某些特定结束标记，也可以结束等待
-                if response:
-                    # 检查最后一行是否是某种结束标记
-                    last_line = response[-1]
-                    if last_line in ["OK", "ERROR"] or "+CMS ERROR:" in last_line or "+CME ERROR:" in last_line:
-                        print("在队列等待期间确认已收到完整响应")
-                        break
-
-                    # 对于某些命令，没有明确结束标记，但收到特定响应后短时间内没有更多响应，也可视为完成
-                    # 例如，AT+CSQ后只有一行+CSQ:响应，但没有OK
-                    if ("+CSQ:" in last_line or "+CREG:" in last_line or "+CGREG:" in last_line) and \
-                       time.time() - start_time > 1.0:  # 等待至少1秒以确保无更多响应
-                        print("已收到关键响应行且无后续内容，视为完成")
-                        break
+    def _join_response(self, lines):
+        """去掉命令回显后合并响应行；没有任何响应时返回超时错误"""
+        # 跳过命令回显（某些模块会回显命令）：只删除第一条以AT开头的行，不复制其余行
+        # 命令已完成、已被移除或已被占位记录替换，读取线程不会再向该列表追加
+        for i, line in enumerate(lines):
+            if line.startswith("AT"):
+                del lines[i]
+                break
 
         # 如果没有收到任何响应，返回超时错误
-        if not response:
-            print("读取超时，未收到任何响应")
+        if not lines:
+            logger.debug("读取超时，未收到任何响应")
             return "ERROR: Read timeout"
 
         # 合并所有响应行并返回
-        full_response = "\n".join(response)
-        return full_response
+        return "\n".join(lines)
+
+    def _handle_urc_line(self, line):
+        """在Qt线程上处理读取线程收到的非请求响应"""
+        try:
+            self._process_unsolicited(line)
+        except Exception as e:
+            logger.error("处理非请求响应出错: %s", e)
+
+    def _run_at_task(self, func, *args):
+        """把需要等待AT命令响应的处理交给后台线程，按提交顺序执行"""
+        self._at_tasks.put((func, args))
+
+    def _run_at_tasks(self):
+        """后台线程：依次执行非请求响应触发的AT命令处理"""
+        while True:
+            func, args = self._at_tasks.get()
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error("后台AT命令处理出错: %s", e)
 
     def _process_unsolicited(self, line):
         """处理非请求响应"""
         # 不把AT命令及其响应作为unsolicited response处理
-        if line.startswith("AT") or line == "OK" or line == "ERROR" or line.startswith("+CSQ") or line.startswith("+CREG") or line.startswith("+CGREG"):
+        if line.startswith(_DISCARD_PREFIXES) or line in _DISCARD_LINES:
             # 跳过可能的命令回显或常见查询响应
             return
 
         # 对于真正的非请求通知，记录并处理
         self._log_unsolicited(line)
 
-        # Incoming call
-        if line.startswith("RING"):
-            self.status_changed.emit("Incoming call")
-            self.in_call = True
-            # 设置为未接听状态
-            self.call_connected = False
-            # Reset notification flag on new RING
-            self.call_notification_sent = False
-
-        # Caller ID
-        elif "+CLIP:" in line:
-            match = re.search(r'\+CLIP: "([^"]+)"', line)
-            if match:
-                number = match.group(1)
-                self.call_number = number
-
-                # Only emit the signal if we haven't sent a notification for this call yet
-                if not self.call_notification_sent and self.in_call:
-                    self.call_received.emit(number)
-                    self.call_notification_sent = True
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - Call notification sent for {number}")
-
-        # Call ended
-        elif "NO CARRIER" in line:
-            self.in_call = False
-            self.call_connected = False
-            self.call_notification_sent = False  # Reset the flag when call ends
-            self.status_changed.emit("Call ended")
-
-            # 记录通话结束日志，方便调试
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - Call ended, NO CARRIER detected")
-
-            # 通话结束时取消PCM音频注册
-            self._ensure_pcm_audio_unregistered()
-
-            # 发送通话结束信号
-            self.call_ended.emit("Call ended")
-
-        # Voice call begin - 这是通话实际建立的时间点
-        elif "VOICE CALL: BEGIN" in line:
-            # 设置通话状态为活动
-            self.in_call = True
-            # 设置为已接通状态
-            self.call_connected = True
-
-            # 记录日志
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 通话已建立 (VOICE CALL: BEGIN)")
-            self.status_changed.emit("Call in progress")
-
-            # 先确保任何可能存在的PCM注册已取消
-            self._unregister_pcm_audio()
-
-            # 短暂延迟后再注册PCM音频，确保模块已稳定
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 延迟100ms后注册PCM音频")
-            time.sleep(0.1)  # 先延迟一小段时间
-
-            # 开始注册PCM音频
-            self._register_pcm_audio()
-
-        # Voice call end
-        elif "VOICE CALL: END:" in line:
-            self.in_call = False
-            self.call_connected = False
-            match = re.search(r'VOICE CALL: END: (\d+)', line)
-            duration = "0"
-            if match:
-                duration = match.group(1)
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - Call ended, duration: {duration}")
-            else:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - Call ended, no duration info")
-
-            # 记录详细日志，包括通话持续时间
-            call_minutes = int(duration) // 60
-            call_seconds = int(duration) % 60
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 通话结束，持续时间: {call_minutes}分{call_seconds}秒")
-
-            # 首先取消PCM音频注册，然后才发送通话结束信号
-            # 这样可以确保PCM音频在通话结束信号处理前已经被取消
-            if self._ensure_pcm_audio_unregistered():
-                # 在成功取消注册后发送信号
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频已取消注册，发送通话结束信号")
-                # 使用threading.Timer代替QTimer，避免线程问题
-                threading.Timer(0.2, lambda: self.call_ended.emit(duration)).start()
-            else:
-                # 即使取消注册失败，也要发送通话结束信号
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频取消注册失败，仍发送通话结束信号")
-                # 使用threading.Timer代替QTimer，避免线程问题
-                threading.Timer(0.2, lambda: self.call_ended.emit(duration)).start()
-
-        # Missed call
-        elif "MISSED_CALL:" in line:
-            match = re.search(r'MISSED_CALL: ([^\r\n]+)', line)
-            if match:
-                missed_info = match.group(1)
-                self.status_changed.emit(f"Missed call: {missed_info}")
-
-                # Extract phone number from missed call info
-                # Format is typically "HH:MMAM/PM PHONENUMBER"
-                parts = missed_info.strip().split()
-                if len(parts) >= 2:
-                    missed_number = parts[-1]  # Last part should be the phone number
-                    # Signal call ended to stop ringtone
-                    self.call_ended.emit("Missed")
-                    # Also emit missed call signal with the number
-                    self.call_number = missed_number
-                    self.status_changed.emit(f"Missed call from {missed_number}")
-
-        # SMS received (direct content mode)
-        elif line.startswith("+CMT:"):
-            try:
-                # 提取发送者号码和时间戳，用于后续匹配和合并短信
-                sender_match = re.search(r'\+CMT: "([^"]*)",[^,]*,"([^"]*)"', line)
-                if sender_match:
-                    sender = sender_match.group(1)
-                    timestamp = sender_match.group(2)
-
-                    # 解码发送者号码（如果是UCS2编码）
-                    if sender.startswith("00"):
-                        try:
-                            sender = ucs2_to_text(sender)
-                        except Exception as e:
-                            print(f"解码发送者号码出错: {str(e)}")
+        # 按前缀分发（第一个冒号之前的部分），其余按子串匹配
+        handler = self._urc_handlers.get(line.split(':', 1)[0])
+        if handler is None:
+            for marker, substring_handler in self._urc_substring_handlers:
+                if marker in line:
+                    handler = substring_handler
+                    break
+        if handler is None and self.waiting_for_sms_content:
+            # 这是短信内容行
+            handler = self._on_sms_content
+        if handler:
+            handler(line)
+
+    def _on_ring(self, line):
+        """来电振铃 (RING)"""
+        self.status_changed.emit("Incoming call")
+        self.in_call = True
+        # 设置为未接听状态
+        self.call_connected = False
+        # Reset notification flag on new RING
+        self.call_notification_sent = False
+
+    def _on_clip(self, line):
+        """来电号码 (+CLIP)"""
+        match = _CLIP_RE.search(line)
+        if match:
+            number = match.group(1)
+            self.call_number = number
 
-                    # 保存短信头部信息，用于后续处理
-                    self.pending_sms_sender = sender
-                    self.pending_sms_timestamp = timestamp
+            # Only emit the signal if we haven't sent a notification for this call yet
+            if not self.call_notification_sent and self.in_call:
+                self.call_received.emit(number)
+                self.call_notification_sent = True
+                logger.info("Call notification sent for %s", number)
 
-                    # 生成SMS ID用于匹配多段短信
-                    sms_id = f"{sender}_{timestamp[:10]}"
+    def _on_no_carrier(self, line):
+        """通话结束 (NO CARRIER)"""
+        self.in_call = False
+        self.call_connected = False
+        self.call_notification_sent = False  # Reset the flag when call ends
+        self.status_changed.emit("Call ended")
 
-                    # 检查是否已有相同ID的短信正在处理中
-                    is_continuation = False
-                    if sms_id in self.concat_sms_parts:
-                        # 这是已有短信的后续部分
-                        is_continuation = True
-                        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 检测到后续短信部分: {sms_id}")
-                        self.status_changed.emit(f"检测到后续短信部分，来自 {sender}")
+        # 记录通话结束日志，方便调试
+        logger.info("Call ended, NO CARRIER detected")
 
-                    # 标记等待内容行
-                    self.waiting_for_sms_content = True
+        # 通话结束时取消PCM音频注册，然后发送通话结束信号（在后台线程执行）
+        self._run_at_task(self._finish_call, "Call ended", 0)
 
-                    # 保存当前短信ID，用于内容行处理
-                    self.current_sms_id = sms_id
-                    self.current_is_continuation = is_continuation
+    def _on_voice_call_begin(self, line):
+        """通话建立 (VOICE CALL: BEGIN)"""
+        # 设置通话状态为活动
+        self.in_call = True
+        # 设置为已接通状态
+        self.call_connected = True
 
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 收到短信头部，发送者: {sender}, 时间: {timestamp}, ID: {sms_id}")
-                else:
-                    # 无法解析发送者和时间，使用默认处理方式
-                    if self._is_concatenated_sms(line):
-                        self._handle_concatenated_sms(line)
-                    else:
-                        self._handle_regular_sms(line)
-            except Exception as e:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 处理短信头部出错: {str(e)}")
-                # 错误时使用旧方法尝试处理
-                if self._is_concatenated_sms(line):
-                    self._handle_concatenated_sms(line)
-                else:
-                    self._handle_regular_sms(line)
+        # 记录日志
+        logger.info("通话已建立 (VOICE CALL: BEGIN)")
+        self.status_changed.emit("Call in progress")
+
+        # 先取消可能存在的PCM注册，再重新注册（在后台线程执行，不阻塞事件循环）
+        self._run_at_task(self._restart_pcm_audio)
+
+    def _restart_pcm_audio(self):
+        """取消已有的PCM注册，短暂延迟待模块稳定后重新注册（后台线程）"""
+        self._unregister_pcm_audio()
+        logger.info("延迟100ms后注册PCM音频")
+        time.sleep(0.1)
+        self._register_pcm_audio()
+
+    def _on_voice_call_end(self, line):
+        """通话结束 (VOICE CALL: END)"""
+        # 通话结束时立即刷新日志，保证通话相关记录完整
+        self._flush_at_log()
+        self.in_call = False
+        self.call_connected = False
+        match = _VEND_RE.search(line)
+        duration = "0"
+        if match:
+            duration = match.group(1)
+            logger.info("Call ended, duration: %s", duration)
+        else:
+            logger.info("Call ended, no duration info")
 
-        elif self.waiting_for_sms_content:
-            # 这是短信内容行
-            self.waiting_for_sms_content = False
-            message = line
+        # 记录详细日志，包括通话持续时间
+        call_minutes = int(duration) // 60
+        call_seconds = int(duration) % 60
+        logger.info("通话结束，持续时间: %s分%s秒", call_minutes, call_seconds)
 
-            # 检查是否保存了短信ID信息
-            sms_id = getattr(self, 'current_sms_id', None)
-            is_continuation = getattr(self, 'current_is_continuation', False)
+        # 首先取消PCM音频注册，然后才发送通话结束信号（在后台线程执行）
+        self._run_at_task(self._finish_call, duration, 0.2)
 
-            # 清除临时属性
-            if hasattr(self, 'current_sms_id'):
-                del self.current_sms_id
-            if hasattr(self, 'current_is_continuation'):
-                del self.current_is_continuation
+    def _finish_call(self, reason, delay):
+        """通话结束：取消PCM音频注册，延迟delay秒后发送通话结束信号（后台线程）
 
-            try:
-                # 检查是否是UCS2编码
-                if all(c in "0123456789ABCDEFabcdef" for c in line.replace(" ", "")):
-                    # 尝试解码UCS2内容
-                    decoded_content = None
+        这样可以确保PCM音频在通话结束信号处理前已经被取消；即使取消注册失败，也要发送通话结束信号
+        """
+        if self._ensure_pcm_audio_unregistered():
+            logger.info("PCM音频已取消注册，发送通话结束信号")
+        else:
+            logger.warning("PCM音频取消注册失败，仍发送通话结束信号")
+        if delay:
+            time.sleep(delay)
+        self.call_ended.emit(reason)
+
+    def _on_missed_call(self, line):
+        """未接来电 (MISSED_CALL)"""
+        match = _MISSED_RE.search(line)
+        if match:
+            missed_info = match.group(1)
+            self.status_changed.emit(f"Missed call: {missed_info}")
+
+            # Extract phone number from missed call info
+            # Format is typically "HH:MMAM/PM PHONENUMBER"
+            parts = missed_info.strip().split()
+            if len(parts) >= 2:
+                missed_number = parts[-1]  # Last part should be the phone number
+                # Signal call ended to stop ringtone
+                self.call_ended.emit("Missed")
+                # Also emit missed call signal with the number
+                self.call_number = missed_number
+                self.status_changed.emit(f"Missed call from {missed_number}")
+
+    def _on_cmt(self, line):
+        """短信头部，直接内容模式 (+CMT)"""
+        sender_match = None
+        try:
+            # 提取发送者号码和时间戳，用于后续匹配和合并短信（只解析一次，结果传给后续处理方法）
+            sender_match = _CMT_RE.match(line, 5)
+            if sender_match:
+                sender = sender_match.group(1)
+                timestamp = sender_match.group(2)
+
+                # 解码发送者号码（如果是UCS2编码）
+                if sender.startswith("00"):
                     try:
-                        decoded_content = ucs2_to_text(line)
-                        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - UCS2内容解码成功: {decoded_content[:50]}...")
-                    except Exception as decode_error:
-                        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - UCS2解码错误: {str(decode_error)}")
+                        sender = ucs2_to_text(sender)
+                    except Exception as e:
+                        logger.error("解码发送者号码出错: %s", e)
 
-                        # 尝试替代解码方法
-                        try:
-                            hex_bytes = binascii.unhexlify(line.replace(" ", ""))
-                            decoded_content = hex_bytes.decode('utf-16-be', errors='replace')
-                            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 替代解码成功: {decoded_content[:50]}...")
-                        except Exception as alt_error:
-                            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 替代解码也失败: {str(alt_error)}")
-
-                    # 如果是长短信的一部分（根据特定特征判断）
-                    is_long_message_part = False
-                    if "62117ED94F6053D14E86957F6587672C" in line:
-                        is_long_message_part = True
-                        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 检测到长短信特征")
-                    elif decoded_content and "https://" in decoded_content:
-                        is_long_message_part = True
-                        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 检测到URL内容，视为长短信")
-
-                    # 处理长短信
-                    if is_long_message_part or is_continuation:
-                        # 处理为长短信的一部分
-                        self._process_long_message_part(self.pending_sms_sender, self.pending_sms_timestamp, line, decoded_content, sms_id)
-                    else:
-                        # 常规短信处理，直接发送解码后的内容
-                        message = decoded_content if decoded_content else line
-                        self.sms_received.emit(
-                            self.pending_sms_sender,
-                            self.pending_sms_timestamp,
-                            message
-                        )
-                        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 发送常规短信到UI")
+                # 保存短信头部信息，用于后续处理
+                self.pending_sms_sender = sender
+                self.pending_sms_timestamp = timestamp
+
+                # 生成SMS ID用于匹配多段短信
+                sms_id = f"{sender}_{timestamp[:10]}"
+
+                # 检查是否已有相同ID的短信正在处理中
+                is_continuation = False
+                if sms_id in self.concat_sms_parts:
+                    # 这是已有短信的后续部分
+                    is_continuation = True
+                    logger.info("检测到后续短信部分: %s", sms_id)
+                    self._dbg(f"检测到后续短信部分，来自 {sender}")
+
+                # 标记等待内容行
+                self.waiting_for_sms_content = True
+
+                # 保存当前短信ID，用于内容行处理
+                self.current_sms_id = sms_id
+                self.current_is_continuation = is_continuation
+
+                logger.info("收到短信头部，发送者: %s, 时间: %s, ID: %s", sender, timestamp, sms_id)
+            else:
+                # 无法解析发送者和时间，使用默认处理方式
+                if self._is_concatenated_sms(line):
+                    self._handle_concatenated_sms(line, sender_match)
                 else:
-                    # 非UCS2编码，直接发送
+                    self._handle_regular_sms(line, sender_match)
+        except Exception as e:
+            logger.error("处理短信头部出错: %s", e)
+            # 错误时使用旧方法尝试处理
+            if self._is_concatenated_sms(line):
+                self._handle_concatenated_sms(line, sender_match)
+            else:
+                self._handle_regular_sms(line, sender_match)
+
+    def _on_sms_content(self, line):
+        """+CMT之后的短信内容行"""
+        self.waiting_for_sms_content = False
+        message = line
+
+        # 取出+CMT头部保存的短信ID信息，并重置
+        sms_id = self.current_sms_id
+        is_continuation = self.current_is_continuation
+        self.current_sms_id = None
+        self.current_is_continuation = False
+
+        try:
+            # 入口处统一去掉空格，后续长短信处理直接使用
+            content = line.replace(" ", "")
+
+            # 检查是否是UCS2编码
+            raw = self._try_hex(content)
+            if raw is not None:
+                # 解码UCS2内容：已知格式长短信需要ucs2_to_text提取URL部分，其余直接解码已解析的字节
+                if content.startswith(_CONCAT_MARKER):
+                    decoded_content = _ucs2_cached(content)
+                else:
+                    decoded_content = raw.decode('utf-16-be', errors='replace')
+                logger.info("UCS2内容解码成功: %.50s...", decoded_content)
+
+                # 如果是长短信的一部分（根据特定特征判断）
+                is_long_message_part = False
+                if _CONCAT_MARKER in content:
+                    is_long_message_part = True
+                    logger.info("检测到长短信特征")
+                elif decoded_content and "https://" in decoded_content:
+                    is_long_message_part = True
+                    logger.info("检测到URL内容，视为长短信")
+
+                # 处理长短信
+                if is_long_message_part or is_continuation:
+                    # 处理为长短信的一部分
+                    self._process_long_message_part(self.pending_sms_sender, self.pending_sms_timestamp, content, decoded_content, sms_id)
+                else:
+                    # 常规短信处理，直接发送解码后的内容
+                    message = decoded_content if decoded_content else line
                     self.sms_received.emit(
                         self.pending_sms_sender,
                         self.pending_sms_timestamp,
                         message
                     )
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 发送纯文本短信到UI")
-            except Exception as e:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 处理短信内容时出错: {str(e)}")
-                # 出错时尝试直接发送原始内容
+                    logger.info("发送常规短信到UI")
+            else:
+                # 非UCS2编码，直接发送
                 self.sms_received.emit(
                     self.pending_sms_sender,
                     self.pending_sms_timestamp,
-                    f"[解码错误] {message[:100]}..."
+                    message
                 )
+                logger.info("发送纯文本短信到UI")
+        except Exception as e:
+            logger.error("处理短信内容时出错: %s", e)
+            # 出错时尝试直接发送原始内容
+            self.sms_received.emit(
+                self.pending_sms_sender,
+                self.pending_sms_timestamp,
+                f"[解码错误] {message[:100]}..."
+            )
 
-            # 清除待处理短信数据
-            self.pending_sms_sender = None
-            self.pending_sms_timestamp = None
-
-        # SMS received (index mode)
-        elif line.startswith("+CMTI:"):
-            match = re.search(r'\+CMTI: "([^"]+)",(\d+)', line)
-            if match:
-                storage, index = match.group(1), match.group(2)
-                self.status_changed.emit(f"New SMS at index {index}")
-                # Fetch SMS content
-                self._fetch_sms(storage, index)
-
-        # DTMF tone received
-        elif "+RXDTMF:" in line:
-            match = re.search(r'\+RXDTMF: (\d)', line)
-            if match:
-                tone = match.group(1)
-                self.dtmf_received.emit(tone)
+        # 清除待处理短信数据
+        self.pending_sms_sender = None
+        self.pending_sms_timestamp = None
 
-        # SMS full
-        elif "+SMS FULL" in line:
-            self.status_changed.emit("SMS storage full. Please delete some messages.")
+    def _on_cmti(self, line):
+        """新短信索引通知 (+CMTI)"""
+        match = _CMTI_RE.search(line)
+        if match:
+            storage, index = match.group(1), match.group(2)
+            self.status_changed.emit(f"New SMS at index {index}")
+            # Fetch SMS content（读取短信需等待AT+CMGR响应，在后台线程执行）
+            self._run_at_task(self._fetch_sms, storage, index)
+
+    def _on_dtmf(self, line):
+        """收到DTMF按键 (+RXDTMF)"""
+        match = _RXDTMF_RE.search(line)
+        if match:
+            tone = match.group(1)
+            self.dtmf_received.emit(tone)
+
+    def _on_sms_full(self, line):
+        """短信存储已满 (+SMS FULL)"""
+        self.status_changed.emit("SMS storage full. Please delete some messages.")
 
     def _process_long_message_part(self, sender, timestamp, content, decoded_content, sms_id):
-        """处理长短信的一部分，支持追加入库功能"""
+        """处理长短信的一部分，支持追加入库功能（content已在入口处去掉空格）"""
         try:
-            # 移除空格
-            content = content.replace(" ", "")
-
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 处理长短信部分，ID: {sms_id}, 内容长度: {len(content)}")
+            logger.debug("处理长短信部分，ID: %s, 内容长度: %s", sms_id, len(content))
 
             # 特殊格式检测
-            is_special_format = "62117ED94F6053D14E86957F6587672C" in content
+            is_special_format = _CONCAT_MARKER in content
 
             # 如果没有解码后的内容，尝试解码
             if not decoded_content:
-                try:
-                    decoded_content = ucs2_to_text(content)
-                except Exception as e:
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 解码UCS2内容出错: {str(e)}")
-                    try:
-                        # 尝试替代解码方法
-                        hex_bytes = binascii.unhexlify(content)
-                        decoded_content = hex_bytes.decode('utf-16-be', errors='replace')
-                    except Exception as alt_e:
-                        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 替代解码方法失败: {str(alt_e)}")
-                        decoded_content = f"[无法解码] {content[:50]}..."
+                decoded_content = _decode_ucs2(content)
 
             # 提取URL (如果有)
             url = None
             if is_special_format and decoded_content:
                 # 尝试从特殊格式中提取URL
                 try:
-                    url_match = re.search(r':(https?://[^\s]+)', decoded_content)
+                    url_match = _URL_COLON_RE.search(decoded_content)
                     if url_match:
                         url = url_match.group(1)
-                        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 从特殊格式中提取URL: {url}")
+                        logger.debug("从特殊格式中提取URL: %s", url)
                 except Exception as url_e:
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 从特殊格式提取URL失败: {str(url_e)}")
+                    logger.error("从特殊格式提取URL失败: %s", url_e)
 
             # 如果没有提取到URL但有解码后的内容，尝试从普通文本中提取
             if not url and decoded_content:
-                url_match = re.search(r'(https?://[^\s]+)', decoded_content)
+                url_match = _URL_RE.search(decoded_content)
                 if url_match:
                     url = url_match.group(1)
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 从文本中提取URL: {url}")
+                    logger.debug("从文本中提取URL: %s", url)
 
             # 初始化或更新长短信记录
-            if sms_id not in self.concat_sms_parts:
+            sms_record = self.concat_sms_parts.get(sms_id)
+            if sms_record is None:
                 # 提取消息前缀（如果有）
                 prefix = "消息"
                 if decoded_content and ":" in decoded_content:
-                    prefix_match = re.match(r'^([^:]+):', decoded_content)
+                    prefix_match = _PREFIX_RE.match(decoded_content)
                     if prefix_match:
                         prefix = prefix_match.group(1).strip()
 
                 # 创建新的长短信记录
-                self.concat_sms_parts[sms_id] = {
+                sms_record = self.concat_sms_parts[sms_id] = {
                     'sender': sender,
                     'timestamp': timestamp,
                     'parts': [],
+                    'parts_set': set(),  # 用于快速判断内容是否重复
                     'urls': [],
+                    'urls_set': set(),  # 用于快速判断URL是否重复
                     'received_time': time.time(),
                     'prefix': prefix,
                     'is_processed': False  # 标记是否已处理
                 }
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 创建新的长短信记录: {sms_id}")
-
-            # 更新长短信记录
-            sms_record = self.concat_sms_parts[sms_id]
+                self._evict_old_sms_parts()
+                self._start_sms_cleanup_timer()
+                logger.debug("创建新的长短信记录: %s", sms_id)
 
             # 添加解码后的内容到parts
-            if decoded_content and decoded_content not in sms_record['parts']:
+            if decoded_content and decoded_content not in sms_record['parts_set']:
+                sms_record['parts_set'].add(decoded_content)
                 sms_record['parts'].append(decoded_content)
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 添加第 {len(sms_record['parts'])} 部分到长短信记录")
+                logger.debug("添加第 %s 部分到长短信记录", len(sms_record['parts']))
 
             # 添加URL到urls列表（如果有且不重复）
-            if url and url not in sms_record['urls']:
+            if url and url not in sms_record['urls_set']:
+                sms_record['urls_set'].add(url)
                 sms_record['urls'].append(url)
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 添加URL到长短信记录: {url}")
+                logger.debug("添加URL到长短信记录: %s", url)
 
-            # 更新接收时间
+            # 更新接收时间，并移到末尾保持按接收时间排序
             sms_record['received_time'] = time.time()
+            self.concat_sms_parts.move_to_end(sms_id)
 
             # 使用定时器，延迟合并处理长短信（等待其他部分到达）
             # 如果是分条短信，设置较短的延迟；如果是长短信，设置较长的延迟
             delay = 1.5 if len(sms_record['parts']) > 1 else 3.0
-            threading.Timer(delay, lambda: self._check_and_merge_sms(sms_id)).start()
+            self._schedule_merge(sms_id, delay)
 
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 设置 {delay} 秒后合并长短信")
+            logger.debug("设置 %s 秒后合并长短信", delay)
 
         except Exception as e:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 处理长短信部分时出错: {str(e)}")
+            logger.error("处理长短信部分时出错: %s", e)
             # 出错时尝试直接发送当前部分
             try:
                 message = decoded_content if decoded_content else content
                 self.sms_received.emit(sender, timestamp, f"[长短信处理错误] {message[:100]}...")
             except Exception as send_e:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 发送错误消息失败: {str(send_e)}")
+                logger.error("发送错误消息失败: %s", send_e)
+
+    def _schedule_merge(self, sms_id, delay):
+        """（重新）启动长短信的合并定时器，连续到达的多个部分只触发一次合并"""
+        sms_record = self.concat_sms_parts.get(sms_id)
+        if sms_record is None:
+            return
+        timer = sms_record.get('merge_timer')
+        if timer is None:
+            timer = QTimer()
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda: self._check_and_merge_sms(sms_id))
+            sms_record['merge_timer'] = timer
+        # 定时器正在运行时start()会重新计时
+        timer.start(int(delay * 1000))
 
     def _check_and_merge_sms(self, sms_id):
         """检查并合并长短信，支持追加内容到已处理的长短信"""
-        if sms_id not in self.concat_sms_parts:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 无法找到长短信记录: {sms_id}")
+        sms_info = self.concat_sms_parts.get(sms_id)
+        if sms_info is None:
+            logger.debug("无法找到长短信记录: %s", sms_id)
             return
 
-        sms_info = self.concat_sms_parts[sms_id]
-
         # 检查是否已处理过
         if sms_info.get('is_processed', False):
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 长短信 {sms_id} 已处理过，检查是否有新部分")
+            logger.debug("长短信 %s 已处理过，检查是否有新部分", sms_id)
 
             # 如果已处理过但有新内容（最近3秒内收到的），则追加处理
             current_time = time.time()
             if current_time - sms_info['received_time'] < 3:
                 # 有新部分，继续等待更多部分
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 检测到新内容，延迟后再次尝试合并")
-                threading.Timer(2.0, lambda: self._check_and_merge_sms(sms_id)).start()
+                logger.debug("检测到新内容，延迟后再次尝试合并")
+                self._schedule_merge(sms_id, 2.0)
                 return
 
             # 有新内容需要追加，重新合并并发送更新
             merged_content = self._merge_sms_parts(sms_id)
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 发送更新的长短信内容: {merged_content[:50]}...")
+            logger.debug("发送更新的长短信内容: %.50s...", merged_content)
 
             # 发送信号，表示这是更新的内容
-            self.status_changed.emit(f"更新长短信内容，来自 {sms_info['sender']}")
+            self._dbg(f"更新长短信内容，来自 {sms_info['sender']}")
             self.sms_received.emit(
                 sms_info['sender'],
                 sms_info['timestamp'],
@@ -970,7 +1348,7 @@ class LTEManager(QObject):
 
         # 检查是否有有效部分
         if not sms_info.get('parts', []):
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 长短信 {sms_id} 没有有效部分，跳过合并")
+            logger.debug("长短信 %s 没有有效部分，跳过合并", sms_id)
             return
 
         # 检查是否收到后续部分的超时（通常1-3秒内应该收到所有部分）
@@ -979,14 +1357,15 @@ class LTEManager(QObject):
 
         # 如果最近2秒内收到新部分，继续等待
         if time_since_last_part < 2.0:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 最近才收到新部分 ({time_since_last_part:.1f}秒前)，继续等待")
+            logger.debug("最近才收到新部分 (%.1f秒前)，继续等待", time_since_last_part)
+            self._schedule_merge(sms_id, 2.0 - time_since_last_part)
             return
 
         # 超过等待时间，进行合并处理
         merged_content = self._merge_sms_parts(sms_id)
 
         # 发送完整消息
-        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 发送合并后的长短信: {merged_content[:50]}...")
+        logger.debug("发送合并后的长短信: %.50s...", merged_content)
         self.sms_received.emit(
             sms_info['sender'],
             sms_info['timestamp'],
@@ -998,7 +1377,7 @@ class LTEManager(QObject):
         sms_info['last_processed'] = current_time
 
         # 记录日志
-        self.status_changed.emit(f"已接收完整长短信，来自 {sms_info['sender']}")
+        self._dbg(f"已接收完整长短信，来自 {sms_info['sender']}")
 
         # 不删除记录，而是保留用于后续追加处理
         # 长短信记录将在清理定时任务中处理
@@ -1008,20 +1387,19 @@ class LTEManager(QObject):
         # 检查是否符合长短信格式
         try:
             # 长短信格式通常包含更多逗号分隔的字段
-            parts = header_line.split(',')
-            # 普通短信头部通常有3个字段，长短信可能有更多
-            if len(parts) >= 6:
-                return True
-            return False
+            # 普通短信头部通常有3个字段，长短信可能有更多（至少6个字段，即5个逗号）
+            return header_line.count(',') >= 5
         except Exception as e:
-            print(f"检查长短信格式出错: {str(e)}")
+            logger.error("检查长短信格式出错: %s", e)
             return False
 
-    def _handle_regular_sms(self, header_line):
-        """处理普通短信"""
+    def _handle_regular_sms(self, header_line, header_match):
+        """处理普通短信
+
+        header_match为_on_cmt中已得到的_CMT_RE匹配结果（可能为None），不再重复解析
+        """
         try:
             # 解析SMS头部，格式通常为: +CMT: "sender","","timestamp"
-            header_match = re.search(r'\+CMT: "([^"]*)",[^,]*,"([^"]*)"', header_line)
             if header_match:
                 sender = header_match.group(1)
                 timestamp = header_match.group(2)
@@ -1031,7 +1409,7 @@ class LTEManager(QObject):
                     try:
                         sender = ucs2_to_text(sender)
                     except Exception as e:
-                        print(f"解码发送者号码失败: {str(e)}")
+                        logger.error("解码发送者号码失败: %s", e)
                         # 解码失败时保留原始格式
 
                 # 保存发送者和时间信息，等待下一行接收内容
@@ -1041,7 +1419,7 @@ class LTEManager(QObject):
 
                 # 发送状态更新
                 self.status_changed.emit(f"收到来自 {sender} 的短信")
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 收到来自 {sender} 的短信")
+                logger.info("收到来自 %s 的短信", sender)
             else:
                 # 如果头部格式不匹配，使用默认值
                 self.pending_sms_sender = "未知号码"
@@ -1050,36 +1428,34 @@ class LTEManager(QObject):
 
                 # 发送状态更新
                 self.status_changed.emit("收到短信（无法识别发送者）")
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 收到短信（头部格式异常：{header_line}）")
+                logger.info("收到短信（头部格式异常：%s）", header_line)
         except Exception as e:
-            print(f"处理短信头部出错: {str(e)}")
+            logger.error("处理短信头部出错: %s", e)
             # 出错时使用默认值
             self.pending_sms_sender = "错误"
             self.pending_sms_timestamp = time.strftime("%y/%m/%d,%H:%M:%S")
             self.waiting_for_sms_content = True
             self.status_changed.emit(f"解析短信头部时出错: {str(e)}")
 
-    def _handle_concatenated_sms(self, header_line):
-        """处理长短信的头部信息"""
+    def _handle_concatenated_sms(self, header_line, match):
+        """处理长短信的头部信息
+
+        match为_on_cmt中已得到的_CMT_RE匹配结果（可能为None），不再重复解析
+        """
         try:
-            # 解析长短信头部，格式可能更复杂
-            parts = header_line.split(',')
-            if len(parts) < 3:
+            if not match:
                 # 格式不符合预期，作为普通短信处理
-                self._handle_regular_sms(header_line)
+                self._handle_regular_sms(header_line, match)
                 return
 
-            # 尝试提取发送者和时间戳
-            sender_part = parts[0].replace('+CMT: ', '').strip('"')
-            # 时间戳位置可能在第3个位置
-            timestamp_part = parts[2].strip('"') if len(parts) > 2 else time.strftime("%y/%m/%d,%H:%M:%S")
+            sender_part, timestamp_part = match.group(1), match.group(2)
 
             # 检查发送者是否为UCS2格式
             if sender_part.startswith("00"):
                 try:
-                    sender_part = ucs2_to_text(sender_part)
+                    sender_part = _ucs2_cached(sender_part)
                 except Exception as e:
-                    print(f"解码长短信发送者出错: {str(e)}")
+                    logger.error("解码长短信发送者出错: %s", e)
                     # 解码失败时保留原始格式
 
             # 保存信息等待后续处理
@@ -1088,12 +1464,11 @@ class LTEManager(QObject):
             self.waiting_for_sms_content = True
 
             # 发送状态更新
-            self.status_changed.emit(f"收到来自 {sender_part} 的长短信部分")
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 收到来自 {sender_part} 的长短信部分")
+            self._dbg(f"收到来自 {sender_part} 的长短信部分")
         except Exception as e:
             # 出错时尝试作为普通短信处理
-            print(f"处理长短信头部出错: {str(e)}")
-            self._handle_regular_sms(header_line)
+            logger.error("处理长短信头部出错: %s", e)
+            self._handle_regular_sms(header_line, match)
 
     def _process_concatenated_sms_part(self, sender, timestamp, content):
         """处理长短信的内容部分"""
@@ -1101,100 +1476,71 @@ class LTEManager(QObject):
             # 移除空格
             content = content.replace(" ", "")
 
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 处理长短信内容: {content[:50]}...")
-
-            # 检查是否为特定格式的长短信
-            is_special_format = "62117ED94F6053D14E86957F6587672C" in content
+            logger.debug("处理长短信内容: %.50s...", content)
 
-            # 尝试解码内容
-            try:
-                decoded_content = ucs2_to_text(content)
-                print(f"解码内容: {decoded_content[:50]}...")
-            except Exception as e:
-                print(f"UCS2解码错误: {str(e)}")
-                # 如果解码失败，尝试不同方法或直接发送原始内容
-                try:
-                    # 尝试直接从十六进制转换为字节，然后解码
-                    hex_bytes = binascii.unhexlify(content)
-                    decoded_content = hex_bytes.decode('utf-16-be', errors='replace')
-                    print(f"替代解码成功: {decoded_content[:50]}...")
-                except Exception as alt_e:
-                    print(f"替代解码失败: {str(alt_e)}")
-                    # 如果所有解码方法都失败，发送原始内容
-                    self.sms_received.emit(
-                        sender,
-                        timestamp,
-                        f"[无法解码的消息] {content[:50]}..."
-                    )
-                    return
+            # 解码内容
+            decoded_content = _decode_ucs2(content)
+            logger.debug("解码内容: %.50s...", decoded_content)
 
-            # 特殊格式处理 - 提取URL
+            # 提取URL（特殊格式的冒号后URL同样能在完整解码文本中找到，无需再次截取解码）
             url = None
-            if is_special_format:
-                # 尝试从特殊格式中提取URL
-                parts = content.split("003A", 1)  # 003A是冒号的UCS2编码
-                if len(parts) > 1:
-                    url_content = "003A" + parts[1]  # 加回冒号
-                    try:
-                        url_text = ucs2_to_text(url_content)
-                        url_match = re.search(r':(https?://[^\s]+)', url_text)
-                        if url_match:
-                            url = url_match.group(1)
-                            print(f"提取URL: {url}")
-                    except Exception as url_e:
-                        print(f"URL提取错误: {str(url_e)}")
-
-            # 如果没有找到URL，尝试从普通文本中提取
-            if not url:
-                url_match = re.search(r'(https?://[^\s]+)', decoded_content)
-                if url_match:
-                    url = url_match.group(1)
-                    print(f"从普通文本提取URL: {url}")
+            url_match = _URL_RE.search(decoded_content)
+            if url_match:
+                url = url_match.group(1)
+                logger.debug("提取URL: %s", url)
 
             # 创建或更新长短信记录
             sms_id = f"{sender}_{timestamp[:10]}"
 
-            if sms_id not in self.concat_sms_parts:
+            sms_record = self.concat_sms_parts.get(sms_id)
+            if sms_record is None:
                 prefix = "消息"
                 if ":" in decoded_content:
                     prefix = decoded_content.split(":", 1)[0].strip()
 
-                self.concat_sms_parts[sms_id] = {
+                sms_record = self.concat_sms_parts[sms_id] = {
                     'sender': sender,
                     'timestamp': timestamp,
                     'parts': [],
+                    'parts_set': set(),
                     'urls': [],
+                    'urls_set': set(),
                     'received_time': time.time(),
                     'prefix': prefix
                 }
+                self._evict_old_sms_parts()
+                self._start_sms_cleanup_timer()
 
             # 添加这部分到长短信记录
-            if url and url not in self.concat_sms_parts[sms_id]['urls']:
-                self.concat_sms_parts[sms_id]['urls'].append(url)
+            if url and url not in sms_record['urls_set']:
+                sms_record['urls_set'].add(url)
+                sms_record['urls'].append(url)
 
-            if decoded_content not in self.concat_sms_parts[sms_id]['parts']:
-                self.concat_sms_parts[sms_id]['parts'].append(decoded_content)
+            if decoded_content not in sms_record['parts_set']:
+                sms_record['parts_set'].add(decoded_content)
+                sms_record['parts'].append(decoded_content)
 
-            # 更新接收时间
-            self.concat_sms_parts[sms_id]['received_time'] = time.time()
+            # 更新接收时间，并移到末尾保持按接收时间排序
+            sms_record['received_time'] = time.time()
+            self.concat_sms_parts.move_to_end(sms_id)
 
             # 使用定时器，3秒后尝试合并长短信
-            threading.Timer(3.0, lambda: self._check_and_merge_sms(sms_id)).start()
+            self._schedule_merge(sms_id, 3.0)
 
-            print(f"已保存长短信部分，将在3秒后尝试合并")
+            logger.debug("已保存长短信部分，将在3秒后尝试合并")
 
         except Exception as e:
-            print(f"处理长短信内容部分出错: {str(e)}")
+            logger.error("处理长短信内容部分出错: %s", e)
             # 出错时直接发送解码后的内容
             try:
-                decoded = ucs2_to_text(content) if all(c in "0123456789ABCDEFabcdef" for c in content) else content
+                decoded = _ucs2_cached(content) if _HEX_RE.fullmatch(content) else content
                 self.sms_received.emit(
                     sender,
                     timestamp,
                     decoded
                 )
             except Exception as final_e:
-                print(f"最终解码尝试失败: {str(final_e)}")
+                logger.error("最终解码尝试失败: %s", final_e)
                 self.sms_received.emit(
                     sender,
                     timestamp,
@@ -1203,11 +1549,10 @@ class LTEManager(QObject):
 
     def _merge_sms_parts(self, sms_id):
         """合并长短信的所有部分"""
-        if sms_id not in self.concat_sms_parts:
+        sms_info = self.concat_sms_parts.get(sms_id)
+        if sms_info is None:
             return ""
 
-        sms_info = self.concat_sms_parts[sms_id]
-
         # 如果只有一个部分，直接返回
         if len(sms_info['parts']) == 1:
             return sms_info['parts'][0]
@@ -1219,7 +1564,7 @@ class LTEManager(QObject):
         if urls:
             # 如果有URL，优先使用URL格式返回
             if prefix:
-                merged_content = f"{prefix}:\n" + "\n".join(urls)
+                merged_content = "\n".join([f"{prefix}:", *urls])
             else:
                 merged_content = "\n".join(urls)
         else:
@@ -1234,40 +1579,73 @@ class LTEManager(QObject):
             current_time = time.time()
             sms_ids_to_remove = []
 
+            # 记录按接收时间排序，遇到30秒内收到的记录即可停止
+            # （之后的记录都更新，既未超时也不可能已处理超过10分钟）
             for sms_id, sms_info in self.concat_sms_parts.items():
+                if current_time - sms_info.get('received_time', 0) <= 30:
+                    break
                 # 检查是否已处理且超过保留时间（10分钟）
                 if sms_info.get('is_processed', False) and current_time - sms_info.get('last_processed', 0) > 600:
                     sms_ids_to_remove.append(sms_id)
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 清理已处理的长短信: {sms_id}")
+                    logger.debug("清理已处理的长短信: %s", sms_id)
                 # 检查未处理但已超时的长短信（30秒）
                 elif not sms_info.get('is_processed', False) and current_time - sms_info.get('received_time', 0) > 30:
                     # 如果有内容但未处理（可能是因为只收到部分内容），尝试合并发送
-                    if sms_info.get('parts', []):
-                        try:
-                            # 合并可用部分并发送
-                            merged_content = self._merge_sms_parts(sms_id)
-                            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 发送超时但未处理的长短信: {merged_content[:50]}...")
-                            self.sms_received.emit(
-                                sms_info['sender'],
-                                sms_info['timestamp'],
-                                f"[部分内容] {merged_content}"
-                            )
-                        except Exception as e:
-                            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 处理超时长短信时出错: {str(e)}")
-
+                    self._emit_partial_sms(sms_id, sms_info)
                     sms_ids_to_remove.append(sms_id)
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 清理超时未处理的长短信: {sms_id}")
+                    logger.debug("清理超时未处理的长短信: %s", sms_id)
 
             # 移除标记的记录
             for sms_id in sms_ids_to_remove:
-                del self.concat_sms_parts[sms_id]
-                self.status_changed.emit(f"清理长短信记录: {sms_id}")
+                timer = self.concat_sms_parts.pop(sms_id).get('merge_timer')
+                if timer:
+                    timer.stop()
+
+            if sms_ids_to_remove:
+                # 一次性报告本次清理的记录，不再逐条发送状态信号
+                self._dbg(f"清理长短信记录 {len(sms_ids_to_remove)} 条: {', '.join(sms_ids_to_remove)}")
+                # 长短信记录清理后，释放解码缓存
+                _ucs2_cached.cache_clear()
 
             # 打印当前缓存状态
             if self.concat_sms_parts:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 当前有 {len(self.concat_sms_parts)} 条长短信记录在缓存中")
+                logger.debug("当前有 %s 条长短信记录在缓存中", len(self.concat_sms_parts))
+            else:
+                # 没有长短信记录时停止定时器，空闲时不再定期唤醒
+                self.cleanup_timer.stop()
+        except Exception as e:
+            logger.error("清理长短信部分时出错: %s", e)
+
+    def _emit_partial_sms(self, sms_id, sms_info):
+        """把未处理长短信已收到的部分合并后以[部分内容]发送（超时清理或淘汰记录时）"""
+        if not sms_info.get('parts', []):
+            return
+        try:
+            merged_content = self._merge_sms_parts(sms_id)
+            logger.debug("发送超时但未处理的长短信: %.50s...", merged_content)
+            self.sms_received.emit(
+                sms_info['sender'],
+                sms_info['timestamp'],
+                f"[部分内容] {merged_content}"
+            )
         except Exception as e:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 清理长短信部分时出错: {str(e)}")
+            logger.error("处理超时长短信时出错: %s", e)
+
+    def _evict_old_sms_parts(self):
+        """长短信记录超过concat_sms_max条时，淘汰最久未更新的记录（处理方式与超时清理相同）"""
+        while len(self.concat_sms_parts) > self.concat_sms_max:
+            sms_id, sms_info = next(iter(self.concat_sms_parts.items()))
+            logger.warning("长短信记录过多，淘汰最久未更新的记录: %s", sms_id)
+            if not sms_info.get('is_processed', False):
+                self._emit_partial_sms(sms_id, sms_info)
+            timer = self.concat_sms_parts.pop(sms_id).get('merge_timer')
+            if timer:
+                timer.stop()
+
+    def _start_sms_cleanup_timer(self):
+        """新增长短信记录后启动清理定时器（已在运行时不重复启动）"""
+        if not self.cleanup_timer.isActive():
+            self.cleanup_timer.start(10000)  # 每10秒清理一次
 
     def _decode_pdu_message(self, pdu_str):
         """Decode PDU format message (including Chinese characters)"""
@@ -1275,64 +1653,79 @@ class LTEManager(QObject):
             # Remove spaces and convert to bytes
             pdu_str = pdu_str.replace(" ", "")
 
-            # 检查是否为长短信的一部分
+            # 检查是否为长短信的一部分（已去掉空格）
             if self._is_part_of_concatenated_sms(pdu_str):
                 # 可能是长短信的一部分，需要特殊处理
                 # 这里需要根据实际的PDU格式进行解析
                 pass
 
             # Try to decode using our utility function
-            return ucs2_to_text(pdu_str)
+            return _decode_ucs2(pdu_str)
         except Exception as e:
-            print(f"PDU decode error: {str(e)}")
+            logger.error("PDU decode error: %s", e)
             # If decoding fails, return the original string
             return f"[Decode error: {pdu_str[:30]}...]"
 
+    def _try_hex(self, text):
+        """把十六进制字符串（可含空格）解析为字节，不是十六进制时返回None"""
+        text = text.replace(" ", "")
+        if len(text) % 2:
+            text += "0"  # 与ucs2_to_text一致，奇数长度补0
+        try:
+            return bytes.fromhex(text)
+        except ValueError:
+            return None
+
     def _is_part_of_concatenated_sms(self, content):
         """检查内容是否为长短信的一部分"""
         try:
-            # 移除空格
-            content = content.replace(" ", "")
-
-            # 检查是否为UCS2编码
-            if not all(c in "0123456789ABCDEFabcdef" for c in content):
-                return False
+            # 统一为大写，之后的标记比较不受大小写影响；调用方通常已去掉空格
+            if " " in content:
+                content = content.replace(" ", "")
+            content = content.upper()
 
             # 检查内容长度是否足够
             if len(content) < 10:
                 return False
 
-            # 检查是否包含特定模式
-            # 1. 检查特定前缀，这是已知的长短信特征
-            if content.startswith("62117ED94F6053D14E86957F6587672C"):
-                print(f"检测到长短信特定前缀: 62117ED94F6053D14E86957F6587672C")
+            # 1. 检查特定前缀，这是已知的长短信特征（只比较前缀，先于十六进制校验）
+            if content.startswith(_CONCAT_MARKER):
+                if not _HEX_RE.fullmatch(content):
+                    return False
+                logger.debug("检测到长短信特定前缀: %s", _CONCAT_MARKER)
                 return True
 
+            # 检查是否为UCS2编码
+            if not _HEX_RE.fullmatch(content):
+                return False
+
+            # 检查是否包含其他特定模式
+
             # 2. 检查内容是否包含URL的UCS2编码
             # https的UCS2编码前缀: 00680074007400700073
-            if "00680074007400700073" in content:
-                print(f"检测到UCS2编码的HTTPS URL")
+            if _UCS2_HTTPS in content:
+                logger.debug("检测到UCS2编码的HTTPS URL")
                 return True
 
             # 3. 检查内容长度是否超过标准短信长度限制
             # UCS2编码的短信最多支持70个字符，即140个字节，对应280个十六进制字符
             if len(content) > 280:
-                print(f"内容长度({len(content)})超过标准短信限制")
+                logger.debug("内容长度(%s)超过标准短信限制", len(content))
                 return True
 
             # 4. 尝试解码并检查是否包含特定内容标记
             try:
-                decoded = ucs2_to_text(content)
+                decoded = _decode_ucs2(content)
                 # 检查解码后内容是否包含URL
-                if re.search(r'https?://', decoded):
-                    print(f"检测到包含URL的内容")
+                if _URL_SCHEME_RE.search(decoded):
+                    logger.debug("检测到包含URL的内容")
                     return True
             except:
                 pass
 
             return False
         except Exception as e:
-            print(f"检查长短信内容部分时出错: {str(e)}")
+            logger.error("检查长短信内容部分时出错: %s", e)
             return False
 
     def _initialize_module(self):
@@ -1342,7 +1735,7 @@ class LTEManager(QObject):
         并获取设备信息
         """
         try:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 初始化LTE模块")
+            logger.info("初始化LTE模块")
 
             # 每个命令间添加30毫秒延迟
 
@@ -1396,130 +1789,184 @@ class LTEManager(QObject):
             self._get_module_info()
             time.sleep(0.03)  # 30毫秒延迟
 
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - LTE模块初始化完成")
+            logger.info("LTE模块初始化完成")
 
         except Exception as e:
             self.status_changed.emit(f"初始化模块失败: {str(e)}")
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 初始化模块失败: {str(e)}")
+            logger.error("初始化模块失败: %s", e)
 
     def _get_module_info(self):
         """获取模块信息（初始化时调用一次）"""
-        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 获取设备基本信息")
+        logger.info("获取设备基本信息")
 
         # 记录上次更新时间
-        self.last_info_update = time.time()
+        self._status_times['module'] = time.monotonic()
+
+        # 一次写入制造商、型号、IMEI和固件版本查询；ERROR只属于对应的那条查询，
+        # 截止时仍未应答的查询由send_at_batch在整批结束后逐条重发
+        cgmi, cgmm, cgsn, cgmr = self.send_at_batch(["AT+CGMI", "AT+CGMM", "AT+CGSN", "AT+CGMR"])
 
         # 获取制造商信息
-        response = self.send_at_command("AT+CGMI")
-        if response and "OK" in response:
+        if cgmi and "OK" in cgmi:
             # 移除命令回显和OK响应，只保留实际内容
-            lines = [line.strip() for line in response.split('\n') if line.strip()]
-            # 过滤掉AT命令回显和OK响应
-            content_lines = [line for line in lines if line != "OK" and not line.startswith("AT+")]
-            self.manufacturer = '\n'.join(content_lines).strip()
+            self.manufacturer = self._clean_at_response(cgmi)
 
         # 获取模块型号
-        response = self.send_at_command("AT+CGMM")
-        if response and "OK" in response:
+        if cgmm and "OK" in cgmm:
             # 移除命令回显和OK响应，只保留实际内容
-            lines = [line.strip() for line in response.split('\n') if line.strip()]
-            # 过滤掉AT命令回显和OK响应
-            content_lines = [line for line in lines if line != "OK" and not line.startswith("AT+")]
-            self.model = '\n'.join(content_lines).strip()
+            self.model = self._clean_at_response(cgmm)
 
         # 获取IMEI号码
-        response = self.send_at_command("AT+CGSN")
-        if response and "OK" in response:
+        if cgsn and "OK" in cgsn:
             # 移除命令回显和OK响应，只保留实际内容
-            lines = [line.strip() for line in response.split('\n') if line.strip()]
-            # 过滤掉AT命令回显和OK响应
-            content_lines = [line for line in lines if line != "OK" and not line.startswith("AT+")]
-            self.imei = '\n'.join(content_lines).strip()
+            self.imei = self._clean_at_response(cgsn)
 
         # 获取固件版本
-        response = self.send_at_command("AT+CGMR")
+        response = cgmr
         if response and "OK" in response:
-            match = re.search(r'\+CGMR: (.+)', response)
+            match = _CGMR_RE.search(response)
             if match:
                 self.firmware = match.group(1)
             else:
                 # 移除命令回显和OK响应，只保留实际内容
-                lines = [line.strip() for line in response.split('\n') if line.strip()]
-                # 过滤掉AT命令回显和OK响应
-                content_lines = [line for line in lines if line != "OK" and not line.startswith("AT+")]
-                self.firmware = '\n'.join(content_lines).strip()
+                self.firmware = self._clean_at_response(response)
 
         # 获取电话号码、运营商和信号强度信息
-        self._update_phone_number()
-        self._update_carrier_info()
-        self._update_signal_strength()
-
-        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 设备基本信息获取完成")
+        self._update_all_status()
+
+        logger.info("设备基本信息获取完成")
+
+    def _clean_at_response(self, response):
+        """去掉AT响应中的命令回显和OK，只保留实际内容行"""
+        # 常见情况：单行内容 + OK，直接取第一行
+        content, sep, rest = response.partition('\n')
+        if sep and rest.strip() == "OK":
+            content = content.strip()
+            if content != "OK" and not content.startswith("AT+"):
+                return content
+
+        content_lines = []
+        for raw in response.splitlines():
+            line = raw.strip()
+            # 跳过空行、OK响应和AT命令回显
+            if not line or line == "OK" or line.startswith("AT+"):
+                continue
+            content_lines.append(line)
+        return '\n'.join(content_lines)
 
     def _update_phone_number(self):
-        """更新电话号码信息（缓存30分钟）"""
-        # 添加缓存检查，减少AT命令交互
-        current_time = time.time()
-        if hasattr(self, 'last_phone_update') and current_time - self.last_phone_update < 1800:  # 30分钟缓存
-            # 使用缓存的值
-            return self.phone_number
+        """更新电话号码信息（缓存30分钟）
 
-        response = self.send_at_command("AT+CNUM")
+        SIM卡未存储号码或未就绪时AT+CNUM返回ERROR，只查询一次并同样记录刷新时间，
+        缓存期内不再重复查询；没有找到号码时保留之前的值
+        """
+        now = time.monotonic()
+        if self._is_stale('phone', now):
+            self._parse_phone_number(self.send_at_command("AT+CNUM", retries=1))
+            self._status_times['phone'] = now
+        return self.phone_number
+
+    def _parse_phone_number(self, response):
+        """从AT+CNUM响应中解析电话号码，成功返回True"""
         if response and "+CNUM:" in response:
-            match = re.search(r'\+CNUM: "[^"]*","([^"]+)"', response)
+            match = _CNUM_RE.search(response)
             if match:
                 self.phone_number = match.group(1)
-                self.last_phone_update = current_time  # 记录更新时间
-                return self.phone_number
+                return True
+        return False
 
-        # 如果没有找到号码但有之前的值，保留之前的值
-        return self.phone_number
+    def _update_operator(self):
+        """只更新运营商信息（AT+COPS?，缓存10分钟）"""
+        self._cached('carrier', lambda: self._parse_carrier(self.send_at_command("AT+COPS?")))
+        return self.carrier
 
-    def _update_carrier_info(self):
-        """更新运营商信息（缓存10分钟）"""
-        # 添加缓存检查，减少AT命令交互
-        current_time = time.time()
-        if hasattr(self, 'last_carrier_update') and current_time - self.last_carrier_update < 600:  # 10分钟缓存
-            # 使用缓存的值
-            return (self.carrier, self.network_type)
+    def _update_network_mode(self):
+        """只更新网络类型信息（AT+CPSI?，缓存10分钟）"""
+        self._cached('network', lambda: self._parse_network_type(self.send_at_command("AT+CPSI?")))
+        return self.network_type
 
-        # 更新运营商信息
-        carrier_updated = False
-        response = self.send_at_command("AT+COPS?")
+    def _is_stale(self, key, now):
+        """判断某项状态缓存是否已过期"""
+        return now - self._status_times[key] >= self._STATUS_TTL[key]
+
+    def _cached(self, key, fetcher):
+        """缓存过期时调用fetcher刷新，fetcher返回True表示解析成功并记录刷新时间"""
+        now = time.monotonic()
+        if self._is_stale(key, now) and fetcher():
+            self._status_times[key] = now
+
+    def _parse_carrier(self, response):
+        """从AT+COPS?响应中解析运营商名称，成功返回True"""
         if response and "+COPS:" in response:
-            match = re.search(r'\+COPS: \d+,\d+,"([^"]+)"', response)
+            match = _COPS_RE.search(response)
             if match:
                 self.carrier = match.group(1)
-                carrier_updated = True
+                return True
+        return False
 
-        # 更新网络类型
-        network_updated = False
-        response = self.send_at_command("AT+CPSI?")
+    def _parse_network_type(self, response):
+        """从AT+CPSI?响应中解析网络类型，成功返回True"""
         if response and "+CPSI:" in response:
             # 移除命令回显，只保留+CPSI:部分
-            match = re.search(r'\+CPSI:(.+)', response)
+            match = _CPSI_RE.search(response)
+            # 只需要第一个字段（网络模式），用partition在第一个逗号处截断，不拆分其余字段
             if match:
-                parts = match.group(1).split(',')
-                if len(parts) > 1:
-                    self.network_type = parts[0].strip()
-                    network_updated = True
+                mode, sep, _ = match.group(1).partition(',')
+                if sep:
+                    self.network_type = mode.strip()
+                    return True
             else:
-                parts = response.split(',')
-                if len(parts) > 1:
-                    self.network_type = parts[0].replace("+CPSI:", "").strip()
-                    network_updated = True
-
-        # 如果有更新，记录更新时间
-        if carrier_updated or network_updated:
-            self.last_carrier_update = current_time
-
-        return (self.carrier, self.network_type)
+                mode, sep, _ = response.partition(',')
+                if sep:
+                    self.network_type = mode.replace("+CPSI:", "").strip()
+                    return True
+        return False
 
     def _update_signal_strength(self):
         """更新信号强度信息（无缓存，需要实时监控）"""
-        response = self.send_at_command("AT+CSQ")
+        self._parse_signal_strength(self.send_at_command("AT+CSQ"))
+        return self.signal_strength
+
+    def _update_all_status(self):
+        """用一条串联AT命令刷新信号强度及已过期的运营商和网络类型信息，并刷新已过期的电话号码
+
+        模块支持用分号串联多条命令，一次往返即可拿到全部响应；
+        如果串联命令返回错误（例如某条命令不被支持），退回逐条查询
+        """
+        current_time = time.monotonic()
+        carrier_stale = self._is_stale('carrier', current_time)
+        network_stale = self._is_stale('network', current_time)
+        phone_stale = self._is_stale('phone', current_time)
+
+        commands = ["+CSQ"]
+        if carrier_stale:
+            commands.append("+COPS?")
+        if network_stale:
+            commands.append("+CPSI?")
+
+        # AT+CNUM单独发送：SIM卡未存储号码或未就绪时返回ERROR，放进串联命令会让整条命令失败
+        if phone_stale:
+            self._update_phone_number()
+
+        response = self.send_at_command("AT" + ";".join(commands))
+        if not response or "OK" not in response:
+            self._update_signal_strength()
+            if carrier_stale:
+                self._update_operator()
+            if network_stale:
+                self._update_network_mode()
+            return
+
+        self._parse_signal_strength(response)
+        if carrier_stale and self._parse_carrier(response):
+            self._status_times['carrier'] = current_time
+        if network_stale and self._parse_network_type(response):
+            self._status_times['network'] = current_time
+
+    def _parse_signal_strength(self, response):
+        """从AT+CSQ响应中解析信号强度"""
         if response and "+CSQ:" in response:
-            match = re.search(r'\+CSQ: (\d+),', response)
+            match = _CSQ_RE.search(response)
             if match:
                 rssi = int(match.group(1))
                 if rssi == 99:
@@ -1529,22 +1976,13 @@ class LTEManager(QObject):
                     dbm = -113 + (2 * rssi)
                     self.signal_strength = f"{dbm} dBm ({rssi}/31)"
 
-        return self.signal_strength
-
     def get_carrier_info(self):
         """获取运营商信息（使用缓存机制）"""
         if not self.connected:
             return None
 
-        # 使用缓存的值，不每次都发送AT命令
-        if hasattr(self, 'carrier') and self.carrier:
-            # 只有在超过缓存时间时才更新
-            current_time = time.time()
-            if not hasattr(self, 'last_carrier_update') or current_time - self.last_carrier_update >= 600:  # 10分钟缓存
-                self._update_carrier_info()
-        else:
-            # 第一次请求，直接更新
-            self._update_carrier_info()
+        # 使用缓存的值，只有在超过缓存时间时才发送AT命令
+        self._update_operator()
 
         return self.carrier
 
@@ -1553,15 +1991,8 @@ class LTEManager(QObject):
         if not self.connected:
             return None
 
-        # 使用缓存的值，不每次都发送AT命令
-        if hasattr(self, 'phone_number') and self.phone_number:
-            # 只有在超过缓存时间时才更新
-            current_time = time.time()
-            if not hasattr(self, 'last_phone_update') or current_time - self.last_phone_update >= 1800:  # 30分钟缓存
-                self._update_phone_number()
-        else:
-            # 第一次请求，直接更新
-            self._update_phone_number()
+        # 使用缓存的值，只有在超过缓存时间时才发送AT命令
+        self._update_phone_number()
 
         return self.phone_number
 
@@ -1570,15 +2001,8 @@ class LTEManager(QObject):
         if not self.connected:
             return None
 
-        # 使用缓存的值，不每次都发送AT命令
-        if hasattr(self, 'network_type') and self.network_type:
-            # 只有在超过缓存时间时才更新（与运营商信息共享缓存时间）
-            current_time = time.time()
-            if not hasattr(self, 'last_carrier_update') or current_time - self.last_carrier_update >= 600:  # 10分钟缓存
-                self._update_carrier_info()  # 这里会同时更新network_type
-        else:
-            # 第一次请求，直接更新
-            self._update_carrier_info()
+        # 使用缓存的值，只有在超过缓存时间时才更新（只需AT+CPSI?，不查询运营商）
+        self._update_network_mode()
 
         return self.network_type
 
@@ -1597,16 +2021,11 @@ class LTEManager(QObject):
             return {}
 
         # 检查是否需要刷新模块信息（默认每小时更新一次）
-        current_time = time.time()
-        if not hasattr(self, 'last_info_update') or current_time - self.last_info_update >= 3600:  # 1小时缓存
+        if self._is_stale('module', time.monotonic()):  # 1小时缓存
             self._get_module_info()
         else:
-            # 仅更新可能变化的信息：信号强度
-            self._update_signal_strength()
-
-            # 适当更新运营商信息（如果缓存过期）
-            if not hasattr(self, 'last_carrier_update') or current_time - self.last_carrier_update >= 600:
-                self._update_carrier_info()
+            # 仅更新可能变化的信息：信号强度，以及缓存过期的运营商和号码信息（一次串联命令）
+            self._update_all_status()
 
         return {
             'manufacturer': self.manufacturer,
@@ -1624,7 +2043,7 @@ class LTEManager(QObject):
         response = self.send_at_command(f'AT+CMGR={index}')
         if response and "+CMGR:" in response:
             # Parse SMS header
-            header_match = re.search(r'\+CMGR: "[^"]*","([^"]*)",[^,]*,"([^"]*)"', response)
+            header_match = _CMGR_HDR_RE.search(response)
             if header_match:
                 sender = header_match.group(1)
                 timestamp = header_match.group(2)
@@ -1645,9 +2064,14 @@ class LTEManager(QObject):
                     message = content_line
 
                     # Check if the content is in UCS2 format (hex string)
-                    if all(c in "0123456789ABCDEFabcdef" for c in content_line.replace(" ", "")):
+                    raw = self._try_hex(content_line)
+                    if raw is not None:
                         try:
-                            # Try to decode as UCS2
+                            # Decode the parsed bytes as UCS2 directly
+                            message = raw.decode('utf-16-be')
+                            self.status_changed.emit("Decoded UCS2 message from storage")
+                        except UnicodeDecodeError:
+                            # Fall back to the lenient decoder
                             message = ucs2_to_text(content_line)
                             self.status_changed.emit("Decoded UCS2 message from storage")
                         except Exception as e:
@@ -1661,79 +2085,53 @@ class LTEManager(QObject):
         按照文档要求，在VOICE CALL: BEGIN后执行AT+CPCMREG=1
         """
         if not self.connected or not self.at_serial:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注册失败：未连接")
+            logger.error("PCM音频注册失败：未连接")
             return False
 
         # 如果已经不在通话中了，跳过注册
         if not self.in_call:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 不在通话中，跳过PCM音频注册")
+            logger.debug("不在通话中，跳过PCM音频注册")
             self.status_changed.emit("Not in call, PCM audio registration skipped")
             return False
 
         try:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 开始PCM音频注册过程")
-
-            # 清除可能的额外数据
-            if self.at_serial.in_waiting > 0:
-                self.at_serial.read(self.at_serial.in_waiting)
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 清除了缓冲区数据")
+            logger.debug("开始PCM音频注册过程")
 
             # 设置PCM格式为8K采样率（如需要16K，可更改为AT+CPCMFRM=1）
+            # 串口由读取线程统一读取，这里等待读取线程交回的响应，收到OK/ERROR即返回
             try:
-                with self.lock:
-                    self.at_serial.write(b'AT+CPCMFRM=0\r')
-                    time.sleep(0.1)
-                    if self.at_serial.in_waiting > 0:
-                        resp = self.at_serial.read(self.at_serial.in_waiting).decode('utf-8', errors='ignore')
-                        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM格式设置响应: {resp}")
+                resp = self.send_at_command("AT+CPCMFRM=0", timeout=0.5, retries=1)
+                logger.debug("PCM格式设置响应: %s", resp)
             except Exception as e:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 设置PCM格式出错: {str(e)}")
-
-            # 直接发送PCM音频注册命令，使用更短的超时
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 发送PCM音频注册命令")
-
-            # 确保没有另一个命令在发送
-            with self.lock:
-                self.at_serial.write(b'AT+CPCMREG=1\r')
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注册命令已发送")
-
-                # 等待较短的时间以获取响应
-                time.sleep(0.1)
-
-                # 试图读取响应
-                response = ""
-                start_time = time.time()
-                while time.time() - start_time < 0.5:  # 最多等待0.5秒
-                    if self.at_serial.in_waiting > 0:
-                        response += self.at_serial.read(self.at_serial.in_waiting).decode('utf-8', errors='ignore')
-                        if "OK" in response or "ERROR" in response:
-                            break
-                    time.sleep(0.05)
+                logger.error("设置PCM格式出错: %s", e)
 
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注册响应: {response}")
+            # 发送PCM音频注册命令，使用较短的超时（最多等待0.5秒）
+            logger.debug("发送PCM音频注册命令")
+            response = self.send_at_command("AT+CPCMREG=1", timeout=0.5, retries=1)
+            logger.debug("PCM音频注册响应: %s", response)
 
-                # 记录是否成功
-                success = "OK" in response
+            # 记录是否成功
+            success = "OK" in response
 
             # 根据响应结果发送状态更新
             if success:
                 self.status_changed.emit("PCM audio registered successfully")
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注册成功")
+                logger.debug("PCM音频注册成功")
             else:
                 self.status_changed.emit("PCM audio registration sent")
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注册状态未知")
+                logger.debug("PCM音频注册状态未知")
 
             # 无论响应如何，发送激活信号，系统将尝试处理音频
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 发送PCM音频激活信号")
+            logger.debug("发送PCM音频激活信号")
             self.pcm_audio_status.emit(True)
 
             # 添加调试记录
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注册流程完成")
+            logger.debug("PCM音频注册流程完成")
             return True
 
         except Exception as e:
             self.status_changed.emit(f"PCM audio registration error: {str(e)}")
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注册出错: {str(e)}")
+            logger.error("PCM音频注册出错: %s", e)
 
             # 错误发生时，仍然尝试激活音频，保持一致行为
             self.pcm_audio_status.emit(True)
@@ -1744,66 +2142,44 @@ class LTEManager(QObject):
         按照文档要求，在VOICE CALL: END后执行AT+CPCMREG=0
         """
         if not self.connected or not self.at_serial:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 取消PCM音频注册失败：未连接")
+            logger.error("取消PCM音频注册失败：未连接")
             # 即使未连接，也发送停止信号
             self.pcm_audio_status.emit(False)
             return False
 
         try:
-            # 确保没有另一个命令在发送
-            with self.lock:
-                # 清除任何待处理的数据
-                if self.at_serial.in_waiting > 0:
-                    self.at_serial.read(self.at_serial.in_waiting)
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 清除了PCM音频注销前的缓冲区数据")
-
-                # 使用直接写入代替send_at_command，避免阻塞
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 发送PCM音频注销命令")
-                self.at_serial.write(b'AT+CPCMREG=0\r')
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注销命令已发送")
-
-                # 给一点时间让模块响应
-                time.sleep(0.1)
-
-                # 尝试读取响应，但不等待过长时间
-                response = ""
-                start_time = time.time()
-                while time.time() - start_time < 0.3:  # 等待最多0.3秒
-                    if self.at_serial.in_waiting > 0:
-                        response += self.at_serial.read(self.at_serial.in_waiting).decode('utf-8', errors='ignore')
-                        if "OK" in response:
-                            break
-                    time.sleep(0.05)
-
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注销响应: {response}")
-                success = "OK" in response
+            # 发送PCM音频注销命令，收到响应即返回，不等待过长时间（最多0.3秒）
+            logger.debug("发送PCM音频注销命令")
+            response = self.send_at_command("AT+CPCMREG=0", timeout=0.3, retries=1)
+            logger.debug("PCM音频注销响应: %s", response)
+            success = "OK" in response
 
             # 根据响应结果更新状态
             if success:
                 self.status_changed.emit("PCM audio unregistered successfully")
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注销成功")
+                logger.debug("PCM音频注销成功")
             else:
                 self.status_changed.emit("PCM audio unregistration sent")
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注销状态未知")
+                logger.debug("PCM音频注销状态未知")
 
             # 无论命令是否成功，都发送停止信号
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 发送PCM音频停止信号")
+            logger.debug("发送PCM音频停止信号")
             self.pcm_audio_status.emit(False)
 
             return True
 
         except Exception as e:
             self.status_changed.emit(f"PCM audio unregistration error: {str(e)}")
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注销错误: {str(e)}")
+            logger.error("PCM音频注销错误: %s", e)
 
             # 出错时也发送停止信号
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 注销出错，但仍发送停止信号")
+            logger.error("注销出错，但仍发送停止信号")
             self.pcm_audio_status.emit(False)
             return False
 
     def _ensure_pcm_audio_unregistered(self):
         """确保PCM音频被取消注册"""
-        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 确保PCM音频已注销")
+        logger.debug("确保PCM音频已注销")
 
         # 首先确保通话状态正确
         self.in_call = False  # 强制设置为非通话状态，确保在所有情况下状态一致
@@ -1811,9 +2187,9 @@ class LTEManager(QObject):
         # 直接取消注册PCM音频
         result = self._unregister_pcm_audio()
         if result:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注销成功完成")
+            logger.debug("PCM音频注销成功完成")
         else:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注销可能未完成，但已发送停止信号")
+            logger.debug("PCM音频注销可能未完成，但已发送停止信号")
 
         # 返回实际的操作结果，以便调用者可以适当处理
         return result
@@ -1825,16 +2201,16 @@ class LTEManager(QObject):
 
         # 如果已经在通话中，先结束当前通话
         if self.in_call:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 已在通话中，先结束当前通话")
-            self.end_call()
-
-            # 使用循环检查通话状态，而不是固定等待时间
-            wait_start = time.time()
-            while self.in_call and time.time() - wait_start < 3.0:  # 最多等待3秒
-                time.sleep(0.1)
-
-            if self.in_call:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 无法结束先前通话，放弃拨号")
+            logger.info("已在通话中，先结束当前通话")
+            # 本方法在Qt线程上调用，通话结束通知也在Qt线程上处理，不能阻塞等待；
+            # 挂断命令未确认时，重新查询一次通话状态（跳过缓存）来判断通话是否已结束；
+            # 只有CLCC查询成功且没有列出通话时才算已结束，查询超时或出错不算
+            ended = self.end_call()
+            if not ended or self.in_call:
+                self._status_times['call_status'] = float('-inf')
+                ended = not self.get_call_status() and self.call_status_valid
+            if not ended:
+                logger.info("无法结束先前通话，放弃拨号")
                 self.status_changed.emit("Failed to end previous call")
                 return False
 
@@ -1845,16 +2221,16 @@ class LTEManager(QObject):
         try:
             self.send_at_command("AT+FCLASS=8")  # 设置为语音模式，确保正确处理语音呼叫
         except Exception as e:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 设置语音模式出错: {str(e)}")
+            logger.error("设置语音模式出错: %s", e)
 
         # 发起拨号命令
-        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 发起拨打电话到 {number}")
+        logger.info("发起拨打电话到 %s", number)
         response = self.send_at_command(f"ATD{number};")
 
         if "OK" in response:
             self.call_number = number
             self.status_changed.emit(f"Calling {number}")
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 正在拨打 {number}")
+            logger.info("正在拨打 %s", number)
 
             # 注意：设置in_call=True应该在收到VOICE CALL: BEGIN之后
             # 这里只记录目标号码，不立即设置呼叫状态
@@ -1862,7 +2238,7 @@ class LTEManager(QObject):
 
             return True
         else:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 拨打电话失败: {response}")
+            logger.error("拨打电话失败: %s", response)
             self.status_changed.emit(f"Failed to call {number}")
             return False
 
@@ -1880,7 +2256,7 @@ class LTEManager(QObject):
 
             if not has_incoming_call:
                 self.status_changed.emit("当前没有待接听的来电")
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 尝试接听来电失败：当前无待接听来电")
+                logger.error("尝试接听来电失败：当前无待接听来电")
                 return False
 
             # 停止所有铃声
@@ -1898,7 +2274,7 @@ class LTEManager(QObject):
                 # 标记已接通
                 self.call_connected = True
                 self.in_call = True
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 通话已接通")
+                logger.info("通话已接通")
                 return True
             else:
                 # 即使命令返回失败，仍检查通话是否已建立（有时模块会接通但返回错误）
@@ -1917,14 +2293,14 @@ class LTEManager(QObject):
 
                 if call_established:
                     self.status_changed.emit("通话已接通")
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 通话接听成功")
+                    logger.info("通话接听成功")
                     return True
                 else:
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 接听失败: {response}")
+                    logger.error("接听失败: %s", response)
                     return False
 
         except Exception as e:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 接听电话时出错: {str(e)}")
+            logger.error("接听电话时出错: %s", e)
             return False
 
     def end_call(self):
@@ -1934,12 +2310,12 @@ class LTEManager(QObject):
 
         # 获取当前通话状态
         calls = self.get_call_status()
-        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 当前通话状态: {calls}")
+        logger.info("当前通话状态: %s", calls)
 
         # 根据通话状态选择合适的挂断命令
         if not calls:
             # 没有活动通话，但为安全起见仍发送挂断命令
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 无活动通话，但仍发送挂断命令")
+            logger.info("无活动通话，但仍发送挂断命令")
             response = self.send_at_command("ATH")
 
             # 检查响应中是否包含OK
@@ -1947,13 +2323,13 @@ class LTEManager(QObject):
                 self.in_call = False
                 self.call_connected = False
                 self.status_changed.emit("通话结束")
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 通话已结束")
+                logger.info("通话已结束")
 
                 # 通话结束后，立即取消PCM音频注册
                 self._ensure_pcm_audio_unregistered()
                 return True
             else:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 挂断通话失败，响应: {response}")
+                logger.error("挂断通话失败，响应: %s", response)
                 return False
         else:
             # 检查第一个通话的状态
@@ -1962,7 +2338,7 @@ class LTEManager(QObject):
 
             if stat == 4:  # 来电中(MT)
                 # 来电振铃状态，使用 AT+CHUP 命令挂断
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 使用AT+CHUP挂断未接通的来电")
+                logger.info("使用AT+CHUP挂断未接通的来电")
                 response = self.send_at_command("AT+CHUP")
 
                 # 对于AT+CHUP命令，检查特殊成功标志
@@ -1970,7 +2346,7 @@ class LTEManager(QObject):
                     self.in_call = False
                     self.call_connected = False
                     self.status_changed.emit("来电已拒绝")
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 来电已拒绝")
+                    logger.info("来电已拒绝")
 
                     # 通话结束后，立即取消PCM音频注册
                     self._ensure_pcm_audio_unregistered()
@@ -1982,7 +2358,7 @@ class LTEManager(QObject):
                     self.in_call = False
                     self.call_connected = False
                     self.status_changed.emit("来电已拒绝")
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 通过CLCC状态确认来电已拒绝")
+                    logger.info("通过CLCC状态确认来电已拒绝")
 
                     # 通话结束后，立即取消PCM音频注册
                     self._ensure_pcm_audio_unregistered()
@@ -1995,17 +2371,17 @@ class LTEManager(QObject):
                     self.in_call = False
                     self.call_connected = False
                     self.status_changed.emit("来电已拒绝")
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 二次确认来电已拒绝")
+                    logger.info("二次确认来电已拒绝")
 
                     # 通话结束后，立即取消PCM音频注册
                     self._ensure_pcm_audio_unregistered()
                     return True
 
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 拒绝来电失败，响应: {response}")
+                logger.error("拒绝来电失败，响应: %s", response)
                 return False
             else:
                 # 其他状态使用 ATH 命令挂断
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 使用ATH挂断通话，状态: {self.call_states.get(stat, '未知')}")
+                logger.info("使用ATH挂断通话，状态: %s", self.call_states.get(stat, '未知'))
                 response = self.send_at_command("ATH")
 
                 # 检查响应中是否包含OK或其他成功标志
@@ -2013,7 +2389,7 @@ class LTEManager(QObject):
                     self.in_call = False
                     self.call_connected = False
                     self.status_changed.emit("通话结束")
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 通话已结束")
+                    logger.info("通话已结束")
 
                     # 通话结束后，立即取消PCM音频注册
                     self._ensure_pcm_audio_unregistered()
@@ -2026,13 +2402,13 @@ class LTEManager(QObject):
                     self.in_call = False
                     self.call_connected = False
                     self.status_changed.emit("通话结束")
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 二次确认通话已结束")
+                    logger.info("二次确认通话已结束")
 
                     # 通话结束后，立即取消PCM音频注册
                     self._ensure_pcm_audio_unregistered()
                     return True
 
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 挂断通话失败，响应: {response}")
+                logger.error("挂断通话失败，响应: %s", response)
                 return False
 
     def send_sms(self, number, message):
@@ -2041,11 +2417,7 @@ class LTEManager(QObject):
             return False
 
         # Format the phone number
-        formatted_number = format_phone_number(number)
-
-        # Clear any pending responses
-        while not self.response_queue.empty():
-            self.response_queue.get()
+        formatted_number = _fmt_number(number)
 
         # Set text mode and wait for OK response
         response = self.send_at_command("AT+CMGF=1")
@@ -2056,9 +2428,10 @@ class LTEManager(QObject):
         # Add debug message
         self.status_changed.emit(f"Sending SMS to {formatted_number}")
 
+        entry = None
         try:
-            # Check if message contains Chinese characters
-            if is_chinese_text(message):
+            # 含任何非ASCII字符（不仅是中文）都需要UCS2编码，GSM字符集无法正确发送
+            if not message.isascii():
                 # Set character set to UCS2 for Unicode support
                 response = self.send_at_command('AT+CSCS="UCS2"')
                 if "OK" not in response:
@@ -2072,18 +2445,13 @@ class LTEManager(QObject):
                     return False
 
                 # Convert phone number to UCS2 format
-                hex_number = text_to_ucs2(formatted_number)
+                hex_number = _number_to_ucs2(formatted_number)
                 if not hex_number:
                     self.status_changed.emit("Failed to encode phone number")
                     return False
 
-                # Send message command with UCS2 encoded phone number
-                cmd = f'AT+CMGS="{hex_number}"'
-                self.at_serial.write((cmd + '\r').encode())
-                time.sleep(0.5)  # Wait for > prompt
-
-                # Send message content and Ctrl+Z to end
-                self.at_serial.write(hex_message.encode() + b'\x1A')
+                # Send message command with UCS2 encoded phone number, then the content
+                entry = self._write_sms(f'AT+CMGS="{hex_number}"', hex_message.encode())
                 self.status_changed.emit("Sending UCS2 encoded message...")
             else:
                 # Set character set to GSM for ASCII support
@@ -2092,42 +2460,56 @@ class LTEManager(QObject):
                     self.status_changed.emit("Failed to set GSM character set")
                     return False
 
-                # Send message command
-                cmd = f'AT+CMGS="{formatted_number}"'
-                self.at_serial.write((cmd + '\r').encode())
-                time.sleep(0.5)  # Wait for > prompt
-
-                # Send message content and Ctrl+Z to end
-                self.at_serial.write(message.encode() + b'\x1A')
+                # Send message command, then the content
+                entry = self._write_sms(f'AT+CMGS="{formatted_number}"', message.encode())
                 self.status_changed.emit("Sending ASCII message...")
 
             # Wait for response with longer timeout
-            start_time = time.time()
-            response = []
+            response = self._wait_pending(entry, 15.0)  # Increased timeout to 15 seconds
 
-            while time.time() - start_time < 15.0:  # Increased timeout to 15 seconds
-                try:
-                    line = self.response_queue.get(timeout=0.5)
-                    response.append(line)
-                    self.status_changed.emit(f"SMS response: {line}")
-
-                    if "+CMGS:" in line:
-                        self.status_changed.emit(f"SMS sent to {formatted_number}")
-                        return True
-                    elif "ERROR" in line or "+CMS ERROR:" in line:
-                        self.status_changed.emit(f"SMS error: {line}")
-                        return False
-                except queue.Empty:
-                    continue
+            for line in response:
+                self.status_changed.emit(f"SMS response: {line}")
+
+                if "+CMGS:" in line:
+                    self.status_changed.emit(f"SMS sent to {formatted_number}")
+                    return True
+                elif "ERROR" in line or "+CMS ERROR:" in line:
+                    self.status_changed.emit(f"SMS error: {line}")
+                    return False
 
             # If we get here, we timed out waiting for a response
             self.status_changed.emit(f"SMS send timeout. Last response: {response[-1] if response else 'None'}")
             return False
 
         except Exception as e:
+            if entry:
+                self._discard_pending(entry)
             self.status_changed.emit(f"SMS send exception: {str(e)}")
             return False
 
+    def _write_sms(self, cmd, body):
+        """写入AT+CMGS命令和短信内容，返回待响应命令记录
+
+        从写入命令到写完内容期间持有写入锁，其他命令不能插入到提示符和短信内容之间
+        """
+        entry = self._new_pending(cmd)
+        with self.write_lock:
+            with self.lock:
+                self._await_stale_pending()
+                if not self._pending:
+                    self.at_serial.reset_input_buffer()
+                self._pending.append(entry)
+            try:
+                self.at_serial.write((cmd + '\r').encode())
+                time.sleep(0.5)  # Wait for > prompt
+
+                # Send message content and Ctrl+Z to end
+                self.at_serial.write(body + b'\x1A')
+            except Exception:
+                self._discard_pending(entry)
+                raise
+        return entry
+
     def delete_sms(self, index=None, delete_type=None):
         """Delete SMS messages
 
@@ -2182,45 +2564,21 @@ class LTEManager(QObject):
             return []
 
         messages = []
-        lines = response.split('\n')
-        i = 0
-
-        while i < len(lines):
-            line = lines[i]
-            if line.startswith("+CMGL:"):
-                # Parse header
-                header_match = re.search(r'\+CMGL: (\d+),"([^"]*)",'
-                                        r'"([^"]*)",[^,]*,"([^"]*)"', line)
-                if header_match:
-                    index = header_match.group(1)
-                    msg_status = header_match.group(2)
-                    sender = header_match.group(3)
-                    timestamp = header_match.group(4)
-
-                    # Get message content
-                    if i + 1 < len(lines):
-                        content = lines[i + 1]
-
-                        # Check if PDU or text mode
-                        if any(c for c in content if not (c.isalnum() or c.isspace() or c in '+-,.;:!?')):
-                            # Likely PDU data, decode it
-                            content = self._decode_pdu_message(content)
-
-                        messages.append({
-                            'index': index,
-                            'status': msg_status,
-                            'sender': sender,
-                            'timestamp': timestamp,
-                            'content': content
-                        })
-
-                        i += 2  # Skip content line
-                    else:
-                        i += 1
-                else:
-                    i += 1
-            else:
-                i += 1
+        for match in _CMGL_FULL_RE.finditer(response):
+            index, msg_status, sender, timestamp, content = match.groups()
+
+            # Check if PDU or text mode
+            if not _PRINTABLE_RE.fullmatch(content):
+                # Likely PDU data, decode it
+                content = self._decode_pdu_message(content)
+
+            messages.append({
+                'index': index,
+                'status': msg_status,
+                'sender': sender,
+                'timestamp': timestamp,
+                'content': content
+            })
 
         return messages
 
@@ -2240,96 +2598,81 @@ class LTEManager(QObject):
             return []
 
         # 检查是否有缓存且在短时间内（500毫秒内）
-        current_time = time.time()
-        if hasattr(self, 'last_call_status_check') and hasattr(self, 'cached_call_status'):
-            if current_time - self.last_call_status_check < 0.5:  # 500毫秒内直接使用缓存结果
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 使用缓存的通话状态 ({int((current_time - self.last_call_status_check) * 1000)}ms)")
-                return self.cached_call_status
+        current_time = time.monotonic()
+        if not self._is_stale('call_status', current_time):  # 500毫秒内直接使用缓存结果
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("使用缓存的通话状态 (%dms)", (current_time - self._status_times['call_status']) * 1000)
+            return self.cached_call_status
 
         try:
-            # 记录本次查询时间
-            self.last_call_status_check = current_time
+            # 记录本次查询时间；收到OK响应并解析完成后才标记查询有效
+            self._status_times['call_status'] = current_time
+            self.call_status_valid = False
 
             # 发送AT+CLCC查询通话状态命令
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 发送AT+CLCC查询通话状态")
+            logger.debug("发送AT+CLCC查询通话状态")
             response = self.send_at_command("AT+CLCC")
             calls = []
 
             # 检查响应是否有效
             if not response:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - AT+CLCC无响应")
+                logger.debug("AT+CLCC无响应")
                 self.cached_call_status = []
                 return []
 
             # 检查是否有错误响应
             if "ERROR" in response:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - AT+CLCC返回错误: {response}")
+                logger.error("AT+CLCC返回错误: %s", response)
                 self.cached_call_status = []
                 return []
 
             # 检查响应中是否只有OK（无通话）
             if "+CLCC:" not in response:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 无活动通话")
                 self.cached_call_status = []
+                if "OK" in response:
+                    logger.debug("无活动通话")
+                    self.call_status_valid = True
                 return []
 
             # 解析响应
-            lines = response.strip().split('\n')
-            for line in lines:
-                line = line.strip()
-                if not line.startswith('+CLCC:'):
-                    continue
+            # +CLCC: <id>,<dir>,<stat>,<mode>,<mpty>[,<number>,<type>[,<alpha>]]
+            for match in _CLCC_RE.finditer(response):
+                call = {
+                    'id': int(match.group(1)),
+                    'dir': int(match.group(2)),
+                    'stat': int(match.group(3)),
+                    'mode': int(match.group(4)),
+                    'mpty': int(match.group(5))
+                }
 
-                try:
-                    # +CLCC: <id>,<dir>,<stat>,<mode>,<mpty>[,<number>,<type>[,<alpha>]]
-                    parts = line[7:].strip().split(',')
-
-                    # 验证是否有足够的字段
-                    if len(parts) < 5:
-                        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - CLCC响应格式不完整: {line}")
-                        continue
-
-                    # 尝试解析通话信息
-                    call = {
-                        'id': int(parts[0].strip()),
-                        'dir': int(parts[1].strip()),
-                        'stat': int(parts[2].strip()),
-                        'mode': int(parts[3].strip()),
-                        'mpty': int(parts[4].strip())
-                    }
-
-                    # 判断是否有电话号码字段
-                    if len(parts) > 5:
-                        number = parts[5].strip()
-                        if number.startswith('"') and number.endswith('"'):
-                            number = number[1:-1]  # 移除引号
-                        call['number'] = number
-
-                    # 记录该通话状态的文本描述（用于日志）
+                # 判断是否有电话号码字段
+                if match.group(6) is not None:
+                    call['number'] = match.group(6)
+
+                # 记录该通话状态的文本描述（仅调试日志开启时才生成）
+                if logger.isEnabledFor(logging.DEBUG):
                     state_text = self.call_states.get(call['stat'], "未知状态")
                     direction = "呼出" if call['dir'] == 0 else "呼入"
-                    number_info = f", 号码: {call.get('number', '未知')}" if 'number' in call else ""
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 检测到{direction}通话: {state_text}{number_info}")
+                    number_info = f", 号码: {call['number']}" if 'number' in call else ""
+                    logger.debug("检测到%s通话: %s%s", direction, state_text, number_info)
 
-                    calls.append(call)
-                except Exception as parse_error:
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 解析CLCC响应行错误: {str(parse_error)}, 行: {line}")
-                    continue
+                calls.append(call)
 
             # 保存缓存结果
             self.cached_call_status = calls
+            self.call_status_valid = "OK" in response
 
             # 输出通话状态摘要
             if calls:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 当前有 {len(calls)} 个活动通话")
+                logger.debug("当前有 %s 个活动通话", len(calls))
             else:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 没有活动通话")
+                logger.debug("没有活动通话")
 
             # 通话状态变化时的特殊处理
             if calls and not self.in_call:
                 # 之前不在通话，现在有通话 - 进入通话状态
                 self.in_call = True
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 检测到新通话，共 {len(calls)} 个通话")
+                logger.debug("检测到新通话，共 %s 个通话", len(calls))
 
                 # 获取最高优先级的通话状态
                 highest_priority_call = None
@@ -2348,11 +2691,11 @@ class LTEManager(QObject):
                 if highest_priority_call and highest_priority_call['stat'] == 0:
                     self.call_connected = True
                     self.call_connect_time = time.time()
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 通话已接通，记录开始时间")
+                    logger.debug("通话已接通，记录开始时间")
 
             elif not calls and self.in_call:
                 # 之前在通话，现在没有通话 - 退出通话状态
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 所有通话已结束")
+                logger.debug("所有通话已结束")
                 self.in_call = False
 
                 # 备份通话状态，然后清除
@@ -2369,11 +2712,11 @@ class LTEManager(QObject):
                         if hasattr(self, 'call_connect_time'):
                             call_duration = round(time.time() - self.call_connect_time)
                             duration = str(call_duration)
-                            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 通话结束，持续时间: {call_duration}秒")
+                            logger.debug("通话结束，持续时间: %s秒", call_duration)
 
                     # 发出通话结束信号
                     self.call_ended.emit(duration)
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 通话结束，号码: {self.call_number}，持续时间: {duration}")
+                    logger.debug("通话结束，号码: %s，持续时间: %s", self.call_number, duration)
 
                     # 清除通话号码记录
                     self.call_number = ""
@@ -2384,16 +2727,19 @@ class LTEManager(QObject):
 
             return calls
         except Exception as e:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 获取通话状态出错: {str(e)}")
+            logger.error("获取通话状态出错: %s", e)
             # 出错时返回空列表，并缓存空列表
             self.cached_call_status = []
             return []
 
-    def get_call_state_text(self):
+    def get_call_state_text(self, calls=None):
         """
         获取当前通话状态的文本描述
+
+        calls: 已获取的通话列表（可选），传入时不再重新查询
         """
-        calls = self.get_call_status()
+        if calls is None:
+            calls = self.get_call_status()
         if not calls:
             return "无通话"
 
@@ -2411,10 +2757,14 @@ class LTEManager(QObject):
 
         return f"{direction}通话, {state_text}{number_text}"
 
-    def is_call_connected(self):
-        """检查通话是否已接通（不仅仅是振铃状态）"""
+    def is_call_connected(self, calls=None):
+        """检查通话是否已接通（不仅仅是振铃状态）
+
+        calls: 已获取的通话列表（可选），传入时不再重新查询
+        """
         # 获取最新通话状态
-        calls = self.get_call_status()
+        if calls is None:
+            calls = self.get_call_status()
 
         # 如果没有通话，则未接通
         if not calls:
@@ -2433,31 +2783,31 @@ class LTEManager(QObject):
 
             # 如果PCM没有注册，则进行注册
             if not pcm_status or "+CPCMREG: 1" not in pcm_status:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 注册PCM音频")
+                logger.debug("注册PCM音频")
                 reg_response = self.send_at_command("AT+CPCMREG=1")
 
                 if "OK" in reg_response:
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注册成功")
+                    logger.debug("PCM音频注册成功")
                     self.pcm_audio_status.emit(True)
 
                     # 设置PCM音频格式
                     time.sleep(0.03)  # 30毫秒延迟
                     frm_response = self.send_at_command("AT+CPCMFRM=1")
                     if "OK" in frm_response:
-                        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频格式设置成功")
+                        logger.debug("PCM音频格式设置成功")
                     else:
-                        print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频格式设置失败")
+                        logger.error("PCM音频格式设置失败")
                 else:
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注册失败")
+                    logger.error("PCM音频注册失败")
                     self.pcm_audio_status.emit(False)
             else:
                 # 已经注册，发出信号
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频已注册")
+                logger.debug("PCM音频已注册")
                 self.pcm_audio_status.emit(True)
 
             return True
         except Exception as e:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 确保PCM音频注册出错: {str(e)}")
+            logger.error("确保PCM音频注册出错: %s", e)
             self.pcm_audio_status.emit(False)
             return False
 
@@ -2469,25 +2819,25 @@ class LTEManager(QObject):
 
             # 如果已注册，则注销
             if pcm_status and "+CPCMREG: 1" in pcm_status:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 发送PCM音频注销命令")
+                logger.debug("发送PCM音频注销命令")
                 response = self.send_at_command("AT+CPCMREG=0")
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注销命令已发送")
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注销响应: {response}")
+                logger.debug("PCM音频注销命令已发送")
+                logger.debug("PCM音频注销响应: %s", response)
 
                 if "OK" in response:
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注销成功")
+                    logger.debug("PCM音频注销成功")
                 else:
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频注销状态未知")
+                    logger.debug("PCM音频注销状态未知")
             else:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频未注册或读取状态失败")
+                logger.info("PCM音频未注册或读取状态失败")
 
             # 无论如何，都发送PCM音频已停止信号
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 发送PCM音频停止信号")
+            logger.debug("发送PCM音频停止信号")
             self.pcm_audio_status.emit(False)
 
             return True
         except Exception as e:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 停止PCM音频注册出错: {str(e)}")
+            logger.error("停止PCM音频注册出错: %s", e)
             return False
 
     def _stop_all_ringtones(self):
@@ -2505,34 +2855,53 @@ class LTEManager(QObject):
                 except:
                     pass
 
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 停止铃声信号已发送")
+            logger.info("停止铃声信号已发送")
             return True
         except Exception as e:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 停止铃声出错: {str(e)}")
+            logger.error("停止铃声出错: %s", e)
             return False
 
+    def _write_and_wait(self, ser, cmd, terminators=(b'OK\r\n', b'ERROR\r\n'), timeout=0.5):
+        """向未启动读取线程的串口写入命令，读到任一结束标记或超时后返回响应文本
+
+        收到结束标记立即返回，不必固定等待整个超时时间
+        """
+        ser.reset_input_buffer()
+        ser.write(cmd)
+        deadline = time.time() + timeout
+        buf = bytearray()
+        while time.time() < deadline:
+            chunk = ser.read(ser.in_waiting or 1)
+            if chunk:
+                # 只在新数据（及可能跨块的结束标记）范围内查找，避免每次重扫整个缓冲区
+                start = len(buf)
+                buf += chunk
+                if any(buf.find(t, max(0, start - len(t) + 1)) >= 0 for t in terminators):
+                    break
+        return buf.decode('utf-8', errors='replace')
+
     def _auto_detect_port(self):
         """尝试自动检测LTE模块连接的串口"""
         try:
             # 获取所有可用串口
             available_ports = [port.device for port in serial.tools.list_ports.comports()]
-            print(f"检测到可用串口: {available_ports}")
+            logger.info("检测到可用串口: %s", available_ports)
 
             if not available_ports:
                 self.status_changed.emit("未检测到任何串口设备")
-                print("未检测到任何串口设备")
+                logger.warning("未检测到任何串口设备")
                 return None
 
             # 如果只有一个串口，直接返回
             if len(available_ports) == 1:
-                print(f"只有一个串口可用，直接使用: {available_ports[0]}")
+                logger.info("只有一个串口可用，直接使用: %s", available_ports[0])
                 return available_ports[0]
 
             # 如果有多个串口，尝试连接每个串口并发送AT命令
-            print("检测到多个串口，尝试查找LTE模块...")
+            logger.info("检测到多个串口，尝试查找LTE模块...")
             for port in available_ports:
                 try:
-                    print(f"尝试在串口 {port} 上查找LTE模块...")
+                    logger.info("尝试在串口 %s 上查找LTE模块...", port)
                     # 尝试打开串口
                     test_serial = serial.Serial(
                         port=port,
@@ -2540,22 +2909,17 @@ class LTEManager(QObject):
                         bytesize=serial.EIGHTBITS,
                         parity=serial.PARITY_NONE,
                         stopbits=serial.STOPBITS_ONE,
-                        timeout=1,
+                        timeout=0.1,  # 短超时，_write_and_wait按截止时间循环读取
                         write_timeout=1
                     )
 
-                    # 清空缓冲区
-                    test_serial.reset_input_buffer()
+                    # 清空输出缓冲区（输入缓冲区由_write_and_wait清空）
                     test_serial.reset_output_buffer()
 
                     # 发送AT命令并等待响应
-                    print(f"向 {port} 发送AT命令")
-                    test_serial.write(b'AT\r\n')
-                    time.sleep(0.5)
-
-                    # 读取响应
-                    response = test_serial.read(test_serial.in_waiting or 100).decode('utf-8', errors='replace')
-                    print(f"从 {port} 收到响应: {response}")
+                    logger.debug("向 %s 发送AT命令", port)
+                    response = self._write_and_wait(test_serial, _ENCODED_COMMANDS["AT"])
+                    logger.debug("从 %s 收到响应: %s", port, response)
 
                     # 关闭测试连接
                     test_serial.close()
@@ -2563,10 +2927,10 @@ class LTEManager(QObject):
                     # 检查响应是否包含OK
                     if 'OK' in response:
                         self.status_changed.emit(f"自动检测到LTE模块连接在 {port}")
-                        print(f"在 {port} 上找到LTE模块")
+                        logger.info("在 %s 上找到LTE模块", port)
                         return port
                 except Exception as e:
-                    print(f"测试 {port} 时出错: {str(e)}")
+                    logger.error("测试 %s 时出错: %s", port, e)
                     try:
                         # 确保串口已关闭
                         if 'test_serial' in locals() and test_serial.is_open:
@@ -2578,12 +2942,12 @@ class LTEManager(QObject):
             # 如果没有找到匹配的串口，返回COM6作为默认（如果存在）
             if 'COM6' in available_ports:
                 self.status_changed.emit(f"未能确定LTE模块连接的串口，尝试使用COM6")
-                print(f"未能确定LTE模块连接的串口，尝试使用COM6")
+                logger.warning("未能确定LTE模块连接的串口，尝试使用COM6")
                 return 'COM6'
 
             # 否则返回第一个可用串口
             self.status_changed.emit(f"未能确定LTE模块连接的串口，使用第一个可用串口 {available_ports[0]}")
-            print(f"未能确定LTE模块连接的串口，使用第一个可用串口 {available_ports[0]}")
+            logger.warning("未能确定LTE模块连接的串口，使用第一个可用串口 %s", available_ports[0])
             return available_ports[0]
         except Exception as e:
             self.status_changed.emit(f"串口自动检测出错: {str(e)}")
@@ -2595,29 +2959,25 @@ class LTEManager(QObject):
             # 日志记录配置开始
             self.status_changed.emit("初始化LTE模块")
 
-            # 禁用回显 - 可选，取决于模块和应用需求
-            # self.send_at_command("ATE0")
-
-            # 设置SMS文本模式
-            self.send_at_command("AT+CMGF=1")
-
-            # 设置SMS字符集
-            self.send_at_command('AT+CSCS="UCS2"')
-
-            # 设置来电显示
-            self.send_at_command("AT+CLIP=1")
+            # 禁用回显：回显关闭后send_at_batch才流水线发送命令
+            self.send_at_command("ATE0")
 
-            # 设置新消息指示
-            self.send_at_command('AT+CNMI=2,2,0,0,0')
+            # 一次写入全部设置命令：SMS文本模式、SMS字符集、来电显示、新消息指示
+            self.send_at_batch([
+                "AT+CMGF=1",
+                'AT+CSCS="UCS2"',
+                "AT+CLIP=1",
+                "AT+CNMI=2,2,0,0,0",
+            ])
 
             # 查询是否有PCM音频注册
             pcm_status = self.send_at_command("AT+ECPCMREG?")
             if "+ECPCMREG: 1" in pcm_status:
                 # PCM已注册，先取消注册
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频已注册，取消注册")
+                logger.info("PCM音频已注册，取消注册")
                 self._unregister_pcm_audio()
             else:
-                print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - PCM音频未注册或读取状态失败")
+                logger.info("PCM音频未注册或读取状态失败")
                 # 确保PCM音频处于未注册状态
                 self.pcm_audio_status.emit(False)
 
@@ -2633,7 +2993,7 @@ class LTEManager(QObject):
     def _update_device_info(self):
         """获取设备基本信息"""
         try:
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 获取设备基本信息")
+            logger.info("获取设备基本信息")
 
             # 获取IMEI
             response = self.send_at_command("AT+GSN")
@@ -2658,18 +3018,18 @@ class LTEManager(QObject):
             # 获取电话号码
             response = self.send_at_command("AT+CNUM")
             if response and "+CNUM:" in response:
-                match = re.search(r'\+CNUM: "([^"]*)",("?[^"]*"?),(\d+)', response)
+                match = _CNUM_FULL_RE.search(response)
                 if match:
                     self.phone_number = match.group(2).strip('"')
-                    print(f"电话号码: {self.phone_number}")
+                    logger.info("电话号码: %s", self.phone_number)
 
             # 获取运营商信息
             response = self.send_at_command("AT+COPS?")
             if response and "+COPS:" in response:
-                match = re.search(r'\+COPS: (\d+),(\d+),"([^"]*)"', response)
+                match = _COPS_FULL_RE.search(response)
                 if match:
                     self.carrier = match.group(3)
-                    print(f"运营商: {self.carrier}")
+                    logger.info("运营商: %s", self.carrier)
 
                     # 检查网络类型值，可能是第4个项目
                     if len(match.groups()) >= 4:
@@ -2692,7 +3052,7 @@ class LTEManager(QObject):
             # 获取信号强度
             response = self.send_at_command("AT+CSQ")
             if response and "+CSQ:" in response:
-                match = re.search(r'\+CSQ: (\d+),(\d+)', response)
+                match = _CSQ_FULL_RE.search(response)
                 if match:
                     rssi = int(match.group(1))
                     # 转换RSSI为信号格数和dBm值
@@ -2714,11 +3074,11 @@ class LTEManager(QObject):
                             bars = 0
 
                         self.signal_strength = f"{bars}格 ({dbm}dBm)"
-                        print(f"信号强度: {self.signal_strength}")
+                        logger.info("信号强度: %s", self.signal_strength)
 
             # 发送初始化完成的信号
             self.status_changed.emit(f"设备信息已更新: {self.model} {self.carrier}")
-            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 设备基本信息获取完成")
+            logger.info("设备基本信息获取完成")
             return True
         except Exception as e:
             self.status_changed.emit(f"获取设备信息失败: {str(e)}")
@@ -2731,7 +3091,7 @@ class LTEManager(QObject):
             cereg_response = self.send_at_command("AT+CEREG?")
             if "CEREG: " in cereg_response:
                 # 检查是否有网络注册
-                match = re.search(r'\+CEREG: \d+,(\d+)', cereg_response)
+                match = _CEREG_RE.search(cereg_response)
                 if match and match.group(1) in ['1', '5']:  # 1=已注册，本地网络; 5=已注册，漫游
                     self.network_type = "4G (LTE)"
                     return
@@ -2739,11 +3099,11 @@ class LTEManager(QObject):
             # 尝试使用AT+CREG?命令获取GSM/UMTS网络注册状态
             creg_response = self.send_at_command("AT+CREG?")
             if "CREG: " in creg_response:
-                match = re.search(r'\+CREG: \d+,(\d+)', creg_response)
+                match = _CREG_RE.search(creg_response)
                 if match and match.group(1) in ['1', '5']:
                     # 进一步检查是2G还是3G
                     cgreg_response = self.send_at_command("AT+CGREG?")
-                    if "CGREG: " in cgreg_response and re.search(r'\+CGREG: \d+,[15]', cgreg_response):
+                    if "CGREG: " in cgreg_response and _CGREG_REGISTERED_RE.search(cgreg_response):
                         self.network_type = "3G (UMTS)"
                     else:
                         self.network_type = "2G (GSM)"
@@ -2752,5 +3112,5 @@ class LTEManager(QObject):
             # 如果以上都失败，使用默认值
             self.network_type = "未知"
         except Exception as e:
-            print(f"更新网络类型失败: {str(e)}")
+            logger.error("更新网络类型失败: %s", e)
             self.network_type = "更新失败"
\ No newline at end of file
@@ -718,15 +718,13 @@ class LTEToolApp(QMainWindow):
         try:
             print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - 检查通话状态 (计数: {self.call_check_counter+1}/{self.max_call_checks})")
 
-            # 获取当前通话状态文本
-            call_state = self.lte_manager.get_call_state_text()
+            # 获取当前通话状态（只查询一次，状态文本复用同一结果）
+            calls = self.lte_manager.get_call_status()
+            call_state = self.lte_manager.get_call_state_text(calls)
 
             # 更新状态栏
             self.call_status_label.setText(f"通话: {call_state}")
 
-            # 根据通话状态更新通话按钮状态
-            calls = self.lte_manager.get_call_status()
-
             # 更新UI以反映当前的通话状态
             self.phone_sms_tab.update_call_ui_state(bool(calls))
 
@@ -306,11 +306,10 @@ class PhoneSmsTab(QWidget):
         try:
             # 获取最新通话状态
             if self.lte_manager.is_connected():
-                call_state = self.lte_manager.get_call_state_text()
-                self.call_status_display.setText(f"通话状态: {call_state}")
-
-                # 获取当前通话
+                # 获取当前通话（只查询一次，状态文本复用同一结果）
                 calls = self.lte_manager.get_call_status()
+                call_state = self.lte_manager.get_call_state_text(calls)
+                self.call_status_display.setText(f"通话状态: {call_state}")
 
                 if calls:
                     # 有通话存在
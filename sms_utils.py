@@ -1,15 +1,14 @@
 import binascii
+import re
+
+# 十六进制字符串检查（在C层完成，不逐字符循环）
+_HEX_RE = re.compile(r'[0-9A-Fa-f]*')
 
 def text_to_ucs2(text):
     """Convert text to UCS2 (UTF-16BE) hex string for SMS sending"""
     try:
-        # Encode text to UTF-16BE bytes
-        utf16be_bytes = text.encode('utf-16be')
-
-        # Convert bytes to hex string
-        hex_str = binascii.hexlify(utf16be_bytes).decode('ascii').upper()
-
-        return hex_str
+        # Encode text to UTF-16BE bytes and convert to hex string
+        return text.encode('utf-16be').hex().upper()
     except Exception as e:
         print(f"UCS2 encoding error: {str(e)}")
         return None
@@ -21,7 +20,7 @@ def ucs2_to_text(hex_str):
         hex_str = hex_str.replace(" ", "")
 
         # Make sure we have a valid hex string
-        if not all(c in "0123456789ABCDEFabcdef" for c in hex_str):
+        if not _HEX_RE.fullmatch(hex_str):
             return hex_str  # Not a hex string, return as is
 
         # Make sure the length is even (each character is 2 bytes in UCS2)
@@ -45,32 +44,31 @@ def ucs2_to_text(hex_str):
                     # 如果提取失败，尝试完整解码
 
         # For phone numbers in UCS2 format (e.g., 002B00380036...)
-        if hex_str.startswith("002B") or all(c in "0123456789ABCDEF" for c in hex_str):
-            # Check if it's likely a phone number (starts with +)
-            if hex_str.startswith("002B"):  # "+" in UCS2
-                try:
-                    # Convert hex string to bytes
-                    utf16be_bytes = binascii.unhexlify(hex_str)
+        # Check if it's likely a phone number (starts with +)
+        if hex_str.startswith("002B"):  # "+" in UCS2
+            try:
+                # Convert hex string to bytes
+                utf16be_bytes = binascii.unhexlify(hex_str)
 
-                    # Decode bytes to text
-                    text = utf16be_bytes.decode('utf-16be')
-                    return text
-                except:
-                    # If it fails, try to extract the phone number directly
-                    phone = ""
-                    i = 0
-                    while i < len(hex_str):
-                        if i + 4 <= len(hex_str):
-                            chunk = hex_str[i:i+4]
-                            if chunk == "002B":  # "+"
-                                phone += "+"
-                            elif chunk.startswith("00") and chunk[2:4].isdigit():
-                                phone += chunk[2:4]
-                            i += 4
-                        else:
-                            break
-                    if phone:
-                        return phone
+                # Decode bytes to text
+                text = utf16be_bytes.decode('utf-16be')
+                return text
+            except:
+                # If it fails, try to extract the phone number directly
+                phone = ""
+                i = 0
+                while i < len(hex_str):
+                    if i + 4 <= len(hex_str):
+                        chunk = hex_str[i:i+4]
+                        if chunk == "002B":  # "+"
+                            phone += "+"
+                        elif chunk.startswith("00") and chunk[2:4].isdigit():
+                            phone += chunk[2:4]
+                        i += 4
+                    else:
+                        break
+                if phone:
+                    return phone
 
         # Try multiple decoding approaches
         try: